@@ -1,13 +1,25 @@
 import sys
+import multiprocessing
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication
+from ui.controllers.emotion_recognition import model_provider, camera_service
 from ui.pyqt.main_window import MainWindow
+from ui.utils.thread_budget import apply_opencv_threads
 
 
 def main():
+    # Size OpenCV's pool before any frame is processed; TensorFlow's pools are
+    # sized when the model loads
+    apply_opencv_threads()
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(camera_service.close)
     window = MainWindow()
     window.show()
+    # Load TensorFlow and the emotion model once the login window has painted
+    QTimer.singleShot(0, model_provider.start_loading)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    # Lets the inference service spawn its processes from a PyInstaller bundle
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,148 @@
+import time
+import threading
+from collections import deque
+from concurrent.futures import Future, CancelledError
+import numpy as np
+
+
+class BatchScheduler:
+    """
+    Collects the face batches of every stream in the process and classifies them
+    together on one shared backend. A forward pass starts once max_batch_size
+    faces are waiting, every active stream has a request waiting, or the oldest
+    request has waited max_delay seconds; the results are split and sent back to
+    each request's Future. A stream is a submitting thread, active while it has
+    submitted within the last stream_timeout seconds, so a lone stream never
+    waits for the deadline.
+    It has the predict() of the inference backends and stands in for one, so
+    every pipeline that calls predict_probabilities() is batched with the others.
+    On a backend with submit(), such as the InferenceService, up to max_in_flight
+    batches (by default one per process) run at once, so the whole pool is kept
+    busy while the next batch forms.
+    """
+    name = "batch-scheduler"
+
+    def __init__(self, backend, max_batch_size=16, max_delay=0.005, stream_timeout=1.0, max_in_flight=None):
+        self.backend = backend
+        if max_in_flight is None:
+            max_in_flight = getattr(backend, "processes", 1)
+        # Batches handed to backend.submit() and not finished yet are limited by this
+        self.in_flight = threading.Semaphore(max_in_flight) if hasattr(backend, "submit") else None
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.stream_timeout = stream_timeout
+        self.pending = deque()
+        self.pending_faces = 0
+        # Stream (thread ID) -> time of its last request
+        self.last_request = {}
+        self.condition = threading.Condition()
+        # Forward passes run and faces classified, for the mean batch size
+        self.batches = 0
+        self.faces = 0
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="BatchScheduler", daemon=True)
+        self.thread.start()
+
+    def submit(self, batch):
+        """
+        Queues a float32 NHWC batch. Returns a Future of its class probabilities.
+        """
+        future = Future()
+        now = time.perf_counter()
+        stream = threading.get_ident()
+        # Copy: callers usually pass a view of a buffer the next frame overwrites
+        request = (np.array(batch, dtype=np.float32), future, now, stream)
+        with self.condition:
+            self.last_request[stream] = now
+            self.pending.append(request)
+            self.pending_faces += len(request[0])
+            self.condition.notify()
+        return future
+
+    def predict(self, batch):
+        """Returns the class probabilities for a float32 NHWC batch."""
+        return self.submit(batch).result()
+
+    def all_streams_waiting(self, now):
+        """True when every active stream has a request in the queue."""
+        for stream, last in list(self.last_request.items()):
+            if now - last > self.stream_timeout:
+                del self.last_request[stream]
+        return len({request[3] for request in self.pending}) >= len(self.last_request)
+
+    def take_batch(self):
+        """
+        Waits until a batch is due and removes its requests from the queue.
+        A single request larger than max_batch_size forms a batch on its own.
+        """
+        with self.condition:
+            while self.running:
+                if self.pending:
+                    now = time.perf_counter()
+                    remaining = self.pending[0][2] + self.max_delay - now
+                    if (self.pending_faces >= self.max_batch_size or remaining <= 0
+                            or self.all_streams_waiting(now)):
+                        break
+                    self.condition.wait(remaining)
+                else:
+                    self.condition.wait()
+            if not self.running:
+                return []
+            requests = [self.pending.popleft()]
+            count = len(requests[0][0])
+            while self.pending and count + len(self.pending[0][0]) <= self.max_batch_size:
+                requests.append(self.pending.popleft())
+                count += len(requests[-1][0])
+            self.pending_faces -= count
+            return requests
+
+    def run(self):
+        while self.running:
+            # Wait for a free backend slot first, so requests keep joining the batch meanwhile
+            if self.in_flight is not None:
+                self.in_flight.acquire()
+            requests = self.take_batch()
+            if not requests:
+                break
+            batch = np.concatenate([request[0] for request in requests])
+            if self.in_flight is not None:
+                future = self.backend.submit(batch)
+                future.add_done_callback(lambda done, requests=requests: self.finish(requests, done))
+                continue
+            try:
+                probabilities = self.backend.predict(batch)
+            except Exception as e:
+                self.fail(requests, e)
+                continue
+            self.send_results(requests, probabilities)
+
+    def finish(self, requests, done):
+        """Called with the backend's Future of a submitted batch once it is done."""
+        self.in_flight.release()
+        if done.cancelled():
+            self.fail(requests, CancelledError())
+            return
+        error = done.exception()
+        if error is not None:
+            self.fail(requests, error)
+        else:
+            self.send_results(requests, done.result())
+
+    def fail(self, requests, error):
+        for _, future, _, _ in requests:
+            future.set_exception(error)
+
+    def send_results(self, requests, probabilities):
+        """Splits the probabilities of a batch between the requests it was made of."""
+        self.batches += 1
+        self.faces += len(probabilities)
+        start = 0
+        for batch, future, _, _ in requests:
+            future.set_result(probabilities[start:start + len(batch)])
+            start += len(batch)
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.thread.join(timeout=1.0)
@@ -0,0 +1,136 @@
+import threading
+import time
+from ui.controllers.frame_capture import LatestFrameSlot
+
+
+class CameraSubscription:
+    """
+    One subscriber's handle on a CameraService. It has the interface of
+    FrameCapture (start, stop, slot, captured, dropped, finished), so a worker
+    can read from the shared camera as from its own capture thread.
+    start() subscribes and stop() unsubscribes; both can be called repeatedly.
+    """
+    def __init__(self, service):
+        self.service = service
+        self.slot = LatestFrameSlot()
+        self.captured = 0
+
+    def start(self):
+        self.service.add(self)
+
+    def stop(self):
+        self.service.remove(self)
+
+    @property
+    def finished(self):
+        return self.service.finished
+
+    @property
+    def dropped(self):
+        return self.slot.dropped
+
+
+class CameraService:
+    """
+    Owns the application's single frame source and hands every frame to all
+    active subscribers through their own LatestFrameSlot. Frames are shared
+    between subscribers and must be treated as read-only.
+
+    The source is opened, and its first warm_up_frames frames skipped, on the
+    capture thread when the first subscriber arrives. When the last one leaves,
+    capture pauses but the device stays open, so the next subscriber gets frames
+    at once instead of waiting for the camera to reopen. close() releases it.
+    """
+    def __init__(self, open_source, warm_up_frames=0, retry_interval=1.0):
+        self.open_source = open_source
+        self.warm_up_frames = warm_up_frames
+        self.retry_interval = retry_interval
+        self.source = None
+        self.subscribers = []
+        self.lock = threading.Lock()
+        self.active = threading.Event()
+        self.captured = 0
+        self.failed_reads = 0
+        self.finished = False
+        self.running = False
+        self.thread = None
+
+    def subscription(self):
+        """Returns a new, not yet started, CameraSubscription."""
+        return CameraSubscription(self)
+
+    def subscriber_count(self):
+        with self.lock:
+            return len(self.subscribers)
+
+    def add(self, subscription):
+        with self.lock:
+            if subscription not in self.subscribers:
+                self.subscribers.append(subscription)
+            self.active.set()
+            if self.thread is None or not self.thread.is_alive():
+                self.running = True
+                self.thread = threading.Thread(target=self.run, name="CameraService", daemon=True)
+                self.thread.start()
+
+    def remove(self, subscription):
+        with self.lock:
+            if subscription in self.subscribers:
+                self.subscribers.remove(subscription)
+            if not self.subscribers:
+                # Pause capture; the device stays open for the next subscriber
+                self.active.clear()
+
+    def open(self):
+        """Opens the source and skips its warm-up frames. Returns False if it failed."""
+        try:
+            source = self.open_source()
+        except Exception as e:
+            print(f"Error opening frame source: {e}")
+            return False
+        if not source.isOpened():
+            print("Error: Unable to open camera")
+            source.release()
+            return False
+        for _ in range(self.warm_up_frames):
+            ret, _ = source.read()
+            if not ret:
+                break
+        self.source = source
+        return True
+
+    def run(self):
+        while self.running:
+            if not self.active.wait(timeout=0.5):
+                continue
+            if self.source is None and not self.open():
+                time.sleep(self.retry_interval)
+                continue
+
+            ret, frame = self.source.read()
+            if not ret:
+                if getattr(self.source, "exhausted", False):
+                    # A recorded or synthetic source has run out of frames
+                    self.finished = True
+                    break
+                self.failed_reads += 1
+                time.sleep(0.01)
+                continue
+
+            self.captured += 1
+            with self.lock:
+                subscribers = list(self.subscribers)
+            for subscription in subscribers:
+                subscription.captured += 1
+                subscription.slot.put(frame)
+
+    def close(self):
+        """Stops capture and releases the source."""
+        self.running = False
+        self.active.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        if self.source is not None:
+            self.source.release()
+            self.source = None
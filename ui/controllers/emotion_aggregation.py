@@ -0,0 +1,185 @@
+import numpy as np
+
+
+class EmotionWindow:
+    """
+    Emotion totals over the last window seconds of a session, kept incrementally.
+    Every sample is one frame's (faces, classes) probability vectors, stored in a
+    fixed-size numpy ring as their sum, the face count and the summed confidence
+    (top probability) of the faces, with its timestamp. Running sums of those are
+    updated as samples enter and leave the window, so add() is O(1) amortised:
+    each sample is subtracted once, with a vectorised sum over the expired run.
+
+    The ring holds window * max_rate samples; above that rate the oldest samples
+    leave early and the window covers slightly less than window seconds.
+
+    The same sums give fixed, back-to-back windows of window seconds for the
+    session overview: each is closed into a summary as the first sample after it
+    arrives, so summaries() costs nothing to read.
+    """
+    def __init__(self, class_names, window=3.0, max_rate=60):
+        self.class_names = list(class_names)
+        self.window = window
+        self.capacity = max(1, int(np.ceil(window * max_rate)))
+        class_count = len(self.class_names)
+        self.vectors = np.zeros((self.capacity, class_count))
+        self.faces = np.zeros(self.capacity)
+        self.confidences = np.zeros(self.capacity)
+        self.times = np.zeros(self.capacity)
+        self.sums = np.zeros(class_count)
+        self.interval_sums = np.zeros(class_count)
+        self.reset()
+
+    def reset(self):
+        """Empties the window and drops the session's summaries."""
+        self.head = 0
+        self.size = 0
+        self.sums.fill(0.0)
+        self.face_count = 0.0
+        self.confidence_sum = 0.0
+        self.started = None
+        self.interval_start = None
+        self.interval_sums.fill(0.0)
+        self.interval_faces = 0.0
+        self.interval_confidence = 0.0
+        self.interval_frames = 0
+        self.closed = []
+
+    def add(self, probabilities, now):
+        """
+        Adds the (faces, classes) probabilities of one frame observed at time now
+        (seconds, non-decreasing).
+        """
+        vector = probabilities.sum(axis=0)
+        faces = len(probabilities)
+        confidence = float(probabilities.max(axis=1).sum())
+
+        if self.started is None:
+            self.started = self.interval_start = now
+        elif now - self.interval_start >= self.window:
+            self.close_interval(now)
+        self.interval_sums += vector
+        self.interval_faces += faces
+        self.interval_confidence += confidence
+        self.interval_frames += 1
+
+        self.advance(now)
+        if self.size == self.capacity:
+            self.drop(1)
+        tail = (self.head + self.size) % self.capacity
+        self.vectors[tail] = vector
+        self.faces[tail] = faces
+        self.confidences[tail] = confidence
+        self.times[tail] = now
+        self.size += 1
+        self.sums += vector
+        self.face_count += faces
+        self.confidence_sum += confidence
+
+    def advance(self, now):
+        """
+        Drops the samples that are more than window seconds older than now, so the
+        window also empties while no faces are seen. Returns the number dropped.
+        """
+        cutoff = now - self.window
+        first = min(self.size, self.capacity - self.head)
+        count = int(np.searchsorted(self.times[self.head:self.head + first], cutoff))
+        if count == first and self.size > first:
+            count += int(np.searchsorted(self.times[:self.size - first], cutoff))
+        if count:
+            self.drop(count)
+        return count
+
+    def drop(self, count):
+        """Removes the count oldest samples from the ring and the running sums."""
+        end = self.head + count
+        if end <= self.capacity:
+            runs = [slice(self.head, end)]
+        else:
+            end -= self.capacity
+            runs = [slice(self.head, self.capacity), slice(0, end)]
+        for run in runs:
+            self.sums -= self.vectors[run].sum(axis=0)
+            self.face_count -= self.faces[run].sum()
+            self.confidence_sum -= self.confidences[run].sum()
+        self.head = end % self.capacity
+        self.size -= count
+        if self.size == 0:
+            # Start again from exact zeros rather than accumulated rounding
+            self.sums.fill(0.0)
+            self.face_count = 0.0
+            self.confidence_sum = 0.0
+
+    def percentages(self):
+        """Returns each emotion's share of the probability in the window, in percent."""
+        total = self.sums.sum()
+        if total <= 0:
+            return np.zeros(len(self.class_names))
+        return self.sums * (100.0 / total)
+
+    def confidence(self):
+        """Returns the average confidence of the faces in the window."""
+        if self.face_count <= 0:
+            return 0.0
+        return self.confidence_sum / self.face_count
+
+    def summary(self, start, end, sums, faces, confidence, frames):
+        total = sums.sum()
+        shares = sums * (100.0 / total) if total > 0 else np.zeros(len(self.class_names))
+        return {
+            "start": start - self.started,
+            "end": end - self.started,
+            "frames": frames,
+            "faces": int(faces),
+            "percentages": dict(zip(self.class_names, shares.tolist())),
+            "confidence": confidence / faces if faces > 0 else 0.0,
+            "dominant": self.class_names[int(np.argmax(sums))] if total > 0 else None,
+        }
+
+    def close_interval(self, now):
+        """Closes the current summary window and starts the one now falls in."""
+        end = self.interval_start + self.window
+        self.closed.append(self.summary(self.interval_start, end, self.interval_sums, self.interval_faces,
+                                        self.interval_confidence, self.interval_frames))
+        # Windows without samples are skipped rather than recorded as empty
+        self.interval_start = end + ((now - end) // self.window) * self.window
+        self.interval_sums.fill(0.0)
+        self.interval_faces = 0.0
+        self.interval_confidence = 0.0
+        self.interval_frames = 0
+
+    def summaries(self, include_current=True):
+        """
+        Returns the session's summaries, one per window of window seconds, with
+        start and end in seconds since the first sample. The window still being
+        filled is included unless include_current is False.
+        """
+        summaries = list(self.closed)
+        if include_current and self.interval_frames:
+            summaries.append(self.summary(self.interval_start, self.interval_start + self.window,
+                                          self.interval_sums, self.interval_faces,
+                                          self.interval_confidence, self.interval_frames))
+        return summaries
+
+
+def combine_summaries(summaries):
+    """
+    Merges window summaries into one for their whole span, weighting every window
+    by its face count. Returns None for no summaries.
+    """
+    if not summaries:
+        return None
+    faces = sum(summary["faces"] for summary in summaries)
+    names = list(summaries[0]["percentages"])
+    weight = 1.0 / faces if faces else 0.0
+    percentages = {name: weight * sum(s["percentages"][name] * s["faces"] for s in summaries) for name in names}
+    total = sum(percentages.values())
+    return {
+        "start": summaries[0]["start"],
+        "end": summaries[-1]["end"],
+        "frames": sum(summary["frames"] for summary in summaries),
+        "faces": faces,
+        "percentages": percentages,
+        "confidence": weight * sum(summary["confidence"] * summary["faces"] for summary in summaries),
+        "dominant": max(percentages, key=percentages.get) if total > 0 else None,
+    }
@@ -2,9 +2,30 @@ import os
 import sys
 import time
 import cv2
-import tensorflow as tf
 from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtGui import QImage
 import numpy as np
+from ui.controllers.camera_service import CameraService
+from ui.controllers.face_detection import create_detector
+from ui.controllers.frame_capture import FrameCapture, LatestFrameSlot
+from ui.controllers.frame_ring import SharedFrameRing
+from ui.controllers.frame_sources import open_frame_source
+from ui.controllers.emotion_smoothing import EmotionSmoother
+from ui.controllers.model_provider import ModelProvider
+from ui.controllers.rate_control import InferenceRateController
+from ui.controllers.preprocessing import FaceBatchBuffer
+from ui.utils.perf_utils import NULL_TIMER, StageTimer, RollingStageStats
+from ui.utils.thread_budget import thread_plan
+from ui.utils.runtime_config import (INFERENCE_BACKEND, TFLITE_MODEL_PATH,
+                                     FACE_DETECTOR, TRACKED_DETECTOR, BUNDLED_CASCADE,
+                                     DETECT_INTERVAL, TRACK_MIN_CONFIDENCE,
+                                     MAX_BATCH_SIZE, WARMUP_ENABLED, FRAME_SOURCE, FRAME_SOURCE_PATH,
+                                     FRAME_SOURCE_PACING, FRAME_SOURCE_LOOP, CAMERA_INDEX,
+                                     INSTRUMENTATION_ENABLED, SMOOTHING_HALF_LIFE,
+                                     RATE_TARGET_FPS, RATE_CPU_BUDGET, INFERENCE_PROCESSES,
+                                     BATCH_SCHEDULER_ENABLED, BATCH_SCHEDULER_SIZE, BATCH_SCHEDULER_DELAY,
+                                     SHARED_FRAMES_ENABLED, FRAME_RING_SLOTS, CAMERA_WIDTH, CAMERA_HEIGHT,
+                                     CAMERA_WARMUP_FRAMES, RESULT_MAILBOX_ENABLED, DETECTION_SCALE)
 
 def get_resource_path(relative_path):
     """
@@ -29,39 +50,69 @@ else:
     cascade_path = os.path.join(parent_directory, "ml", "haarcascade_frontalface_default.xml")
     model_path = os.path.join(parent_directory, "ml", "model.h5")
 
-# Debugging paths
-print("Cascade Path:", cascade_path)
-print("Model Path:", model_path)
-
-# Validate files
-if not os.path.exists(cascade_path):
-    raise FileNotFoundError(f"Haar Cascade file not found: {cascade_path}")
-
-if not os.path.exists(model_path):
-    raise FileNotFoundError(f"Model file not found: {model_path}")
-
-# Load Haar Cascade
-try:
-    cascade = cv2.CascadeClassifier(cascade_path)
-    if cascade.empty():
-        raise IOError(f"Failed to load Haar Cascade from {cascade_path}")
-except Exception as e:
-    print(f"Error loading Haar Cascade: {e}")
-    sys.exit(1)
-
-# Load TensorFlow model
-try:
-    model = tf.keras.models.load_model(model_path)
-except Exception as e:
-    print(f"Error loading model: {e}")
-    sys.exit(1)
+tflite_model_path = TFLITE_MODEL_PATH or os.path.splitext(model_path)[0] + ".tflite"
+active_model_path = tflite_model_path if INFERENCE_BACKEND == "tflite" else model_path
+
+def load_models():
+    """
+    Loads the face detector of detect_face() and the emotion model with the
+    configured inference backend.
+    Runs on the model provider's background thread; TensorFlow is imported here
+    so that importing this module stays cheap.
+    """
+    # Debugging paths
+    print("Cascade Path:", cascade_path)
+    print("Model Path:", active_model_path)
+
+    # Validate files
+    if not os.path.exists(cascade_path):
+        raise FileNotFoundError(f"Haar Cascade file not found: {cascade_path}")
+
+    if not os.path.exists(active_model_path):
+        raise FileNotFoundError(f"Model file not found: {active_model_path}")
+
+    # The configured face detector; pipelines create their own, as it keeps state between frames
+    detector = create_face_detector(**DETECT_FACE_PARAMS)
+
+    # Load the emotion model, in-process or in the processes of the shared inference service
+    tflite_threads = thread_plan()["tflite"]
+    if INFERENCE_PROCESSES > 0:
+        from ui.controllers.inference_service import InferenceService
+        backend = InferenceService(INFERENCE_BACKEND, model_path, tflite_model_path, tflite_threads,
+                                   INFERENCE_PROCESSES, MAX_BATCH_SIZE if WARMUP_ENABLED else 0)
+        backend.start()
+    else:
+        from ui.controllers.inference_backends import load_backend
+        backend = load_backend(INFERENCE_BACKEND, model_path, tflite_model_path, num_threads=tflite_threads)
+
+    # Batch the faces of all streams together on the one model
+    if BATCH_SCHEDULER_ENABLED:
+        from ui.controllers.batch_scheduler import BatchScheduler
+        backend = BatchScheduler(backend, BATCH_SCHEDULER_SIZE, BATCH_SCHEDULER_DELAY)
+
+    return {"detector": detector, "backend": backend}
+
+def warm_up_models(resources):
+    """
+    Runs the face detector on a blank frame and the model on synthetic batches of every
+    size up to MAX_BATCH_SIZE (the batch size of the scheduler, when enabled), so
+    the first real frames are not slowed by tracing and allocation.
+    """
+    from ui.controllers.inference_backends import warm_up
+    resources["detector"].detect(np.zeros((240, 320), dtype=np.uint8))
+    # The batch scheduler combines streams into batches up to its own size
+    warm_up(resources["backend"], BATCH_SCHEDULER_SIZE if BATCH_SCHEDULER_ENABLED else MAX_BATCH_SIZE)
+
+# Shared provider; the app starts it once the first window is shown
+model_provider = ModelProvider(load_models, warm_up_models if WARMUP_ENABLED else None)
 
 def detect_emotion(frame_p):
     """
     Predicts the emotion given a preprocessed face frame.
     """
     try:
-        emotion = model.predict(tf.expand_dims(frame_p, axis=0), verbose=0)[0]
+        batch = np.asarray(frame_p, dtype=np.float32)[np.newaxis]
+        emotion = model_provider.get("backend").predict(batch)[0]
         idx = np.argmax(emotion)
         conf = np.max(emotion)
         return idx, conf
@@ -69,6 +120,40 @@ def detect_emotion(frame_p):
         print("Error in detect_emotion:", e)
         return 0, 0.0
 
+def predict_probabilities(faces_p):
+    """
+    Returns the (n, classes) emotion probabilities of several preprocessed faces,
+    given as a list or a float32 NHWC batch (e.g. from a FaceBatchBuffer).
+    """
+    backend = model_provider.get("backend")
+    if isinstance(faces_p, np.ndarray):
+        batch = np.asarray(faces_p, dtype=np.float32)
+    else:
+        batch = np.stack(faces_p).astype(np.float32)
+    # Batches larger than MAX_BATCH_SIZE are split, so only warmed-up sizes run
+    return np.concatenate([
+        backend.predict(batch[start:start + MAX_BATCH_SIZE])
+        for start in range(0, len(batch), MAX_BATCH_SIZE)
+    ])
+
+def detect_emotions(faces_p):
+    """
+    Predicts the emotions of several preprocessed face frames at once.
+    faces_p is a list of preprocessed faces or a float32 NHWC batch (e.g. from
+    a FaceBatchBuffer), so the model runs a single forward pass per frame.
+    Returns a list of (idx, conf) in input order.
+    """
+    if len(faces_p) == 0:
+        return []
+    try:
+        emotions = predict_probabilities(faces_p)
+        idxs = np.argmax(emotions, axis=1)
+        confs = np.max(emotions, axis=1)
+        return list(zip(idxs, confs))
+    except Exception as e:
+        print("Error in detect_emotions:", e)
+        return [(0, 0.0)] * len(faces_p)
+
 def preprocess(frame_p):
     """
     Converts frame to RGB, resizes to (48,48), and normalizes pixel values.
@@ -76,87 +161,407 @@ def preprocess(frame_p):
     try:
         frame_p = cv2.cvtColor(frame_p, cv2.COLOR_BGR2RGB)
         frame_p = cv2.resize(frame_p, (48, 48))
-        frame_p = frame_p / 255.0
-        return frame_p
+        return np.multiply(frame_p, np.float32(1.0 / 255.0), dtype=np.float32)
     except Exception as e:
         print("Error in preprocess:", e)
-        return np.zeros((48, 48, 3))
+        return np.zeros((48, 48, 3), dtype=np.float32)
 
 def detect_face(frame_p):
     """
-    Detects faces in the given frame using the loaded Haar Cascade.
+    Detects faces in the given frame with the loaded face detector.
     """
     try:
         gray = cv2.cvtColor(frame_p, cv2.COLOR_BGR2GRAY)
-        faces = cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=4)
+        faces = model_provider.get("detector").detect(gray)
         return gray, faces
     except Exception as e:
         print("Error in detect_face:", e)
         return frame_p, []
 
+def create_face_detector(**params):
+    """
+    Creates the face detector selected in runtime_config around the ui/ml cascade.
+    params tune the cascade: scale_factor, min_neighbors, min_size, max_size, detection_scale.
+    """
+    return create_detector(FACE_DETECTOR, cascade_path, BUNDLED_CASCADE, TRACKED_DETECTOR,
+                           DETECT_INTERVAL, TRACK_MIN_CONFIDENCE, **params)
+
+# Detector settings of detect_face(), for frames of any size
+DETECT_FACE_PARAMS = {"min_neighbors": 4}
+
+# Detector settings of the emotion pipeline. Face sizes are in pixels of its 320x240
+# frames (120-400 at 640x480); detection is downscaled as set by DETECTION_SCALE
+PIPELINE_DETECTOR_PARAMS = {"min_neighbors": 4, "min_size": 60, "max_size": 200,
+                            "detection_scale": DETECTION_SCALE}
+
+def create_frame_source(width=None, height=None):
+    """
+    Opens the frame source selected in runtime_config: the camera, a recorded
+    clip, a directory of images or the synthetic generator.
+    """
+    return open_frame_source(FRAME_SOURCE, FRAME_SOURCE_PATH, width, height,
+                             FRAME_SOURCE_PACING, CAMERA_INDEX, FRAME_SOURCE_LOOP)
+
+# The one camera (or replay source) of the application, shared by every page and worker
+camera_service = CameraService(lambda: create_frame_source(CAMERA_WIDTH, CAMERA_HEIGHT),
+                               CAMERA_WARMUP_FRAMES if FRAME_SOURCE == "camera" else 0)
+
+def create_rate_controller(detector):
+    """
+    Creates an InferenceRateController for the budget set in runtime_config,
+    or returns None when no budget is set.
+    """
+    if RATE_TARGET_FPS <= 0 and RATE_CPU_BUDGET <= 0:
+        return None
+    return InferenceRateController(RATE_TARGET_FPS, RATE_CPU_BUDGET, detector.detect_interval)
+
+def track_faces(frame_p, detector):
+    """
+    Finds faces with a face detector. Returns the gray frame and
+    [(track_id, box), ...]; the ID is None for detectors without tracking.
+    """
+    try:
+        gray = cv2.cvtColor(frame_p, cv2.COLOR_BGR2GRAY)
+        return gray, detector.track(gray)
+    except Exception as e:
+        print("Error in track_faces:", e)
+        return frame_p, []
+
+class EmotionPipeline:
+    """
+    The per-frame work of EmotionDetectionWorker without Qt: resize, detect,
+    preprocess, predict, aggregate and annotate. Headless benchmarks run it directly.
+    frame_size of None keeps the frame at its own size.
+    Predictions are smoothed per tracked face by an EmotionSmoother before they
+    are labeled; faces without a track ID are keyed by their position in the frame.
+    Faces are classified every classify_interval frames and show their held
+    estimate in between; a face without an estimate is classified at once.
+    An InferenceRateController, when given, sets the detection and classification
+    intervals from the measured stage costs.
+    An optional StageTimer records the duration of each of those stages.
+    """
+    def __init__(self, class_names, detector=None, frame_size=(320, 240), half_life=SMOOTHING_HALF_LIFE,
+                 rate_controller=None):
+        self.class_names = class_names
+        self.detector = detector if detector is not None else create_face_detector(**PIPELINE_DETECTOR_PARAMS)
+        self.frame_size = frame_size
+        self.face_batch = FaceBatchBuffer(MAX_BATCH_SIZE)
+        self.smoother = EmotionSmoother(len(class_names), half_life)
+        self.rate_controller = rate_controller
+        self.stage_timer = StageTimer()
+        self.classify_interval = 1
+        self.frames_since_classification = 0
+        # [(track_id, box), ...] and the smoothed (n, classes) probabilities of the last frame
+        self.tracks = []
+        self.probabilities = np.zeros((0, len(class_names)), dtype=np.float32)
+        self.classified = False
+        if rate_controller is not None:
+            self.apply_rates()
+
+    def apply_rates(self):
+        self.detector.set_detect_interval(self.rate_controller.detect_interval)
+        self.classify_interval = self.rate_controller.classify_interval
+
+    def classify(self, gray, faces, keys, now):
+        """
+        Returns the smoothed probabilities of the faces, classifying them when
+        they are due or one of them has no held estimate.
+        """
+        self.frames_since_classification += 1
+        if self.frames_since_classification < self.classify_interval:
+            held = [self.smoother.estimate(key, now) for key in keys]
+            if all(estimate is not None for estimate in held):
+                self.classified = False
+                return np.array(held)
+
+        self.frames_since_classification = 0
+        self.classified = True
+        # Write every face into the reusable batch so they are classified in one pass
+        faces_p = self.face_batch.fill(gray, faces)
+        self.timer.mark("preprocess")
+        probabilities = predict_probabilities(faces_p)
+        self.timer.mark("predict")
+        return self.smoother.update(keys, probabilities, now)
+
+    def warm_up(self):
+        """
+        Runs the pipeline's own detector once on a blank frame: the first detection
+        of a cascade allocates its buffers, which would otherwise slow the first frame.
+        """
+        width, height = self.frame_size or (320, 240)
+        self.detector.detect(np.zeros((height, width), dtype=np.uint8))
+        self.detector.reset()
+
+    def process(self, frame, timer=NULL_TIMER, now=None, out=None):
+        """
+        Returns the annotated frame, {emotion: summed confidence} and the average confidence.
+        now is the frame time in seconds used for smoothing, by default the current time.
+        out is an optional uint8 array of the output frame's shape (e.g. a shared
+        frame ring slot); the frame is resized and annotated in it directly.
+        """
+        now = time.perf_counter() if now is None else now
+        if timer is NULL_TIMER and self.rate_controller is not None:
+            # The controller needs the stage costs even when nobody else times them
+            timer = self.stage_timer
+            timer.start()
+        self.timer = timer
+        self.classified = False
+
+        # Resize the frame for consistent processing
+        if out is not None:
+            if self.frame_size is not None:
+                cv2.resize(frame, self.frame_size, dst=out)
+            else:
+                np.copyto(out, frame)
+            frame = out
+        elif self.frame_size is not None:
+            frame = cv2.resize(frame, self.frame_size)
+        timer.mark("resize")
+
+        gray, self.tracks = track_faces(frame, self.detector)
+        faces = [box for _, box in self.tracks]
+        labels = ["" if track_id is None else f" #{track_id}" for track_id, _ in self.tracks]
+        keys = [i if track_id is None else track_id for i, (track_id, _) in enumerate(self.tracks)]
+        timer.mark("detect")
+
+        emotions = {}
+        avg_confidence = 0
+        self.probabilities = self.probabilities[:0]
+        # Check if we have detected any faces
+        if len(faces) > 0:
+            try:
+                self.probabilities = self.classify(gray, faces, keys, now)
+            except Exception as e:
+                print("Error in EmotionPipeline.classify:", e)
+
+        if len(self.probabilities) > 0:
+            total_confidence = 0
+            emotion_labels = []
+            for idx, conf in zip(np.argmax(self.probabilities, axis=1), np.max(self.probabilities, axis=1)):
+                emotion_label = self.class_names[idx]
+                emotions[emotion_label] = emotions.get(emotion_label, 0) + conf
+                total_confidence += conf
+                emotion_labels.append(emotion_label)
+            avg_confidence = total_confidence / len(faces)
+            timer.mark("aggregate")
+
+            for (x, y, w, h), emotion_label, track_label in zip(faces, emotion_labels, labels):
+                # Draw bounding box and label on the frame
+                cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 1)
+                label_position = (x, y - 10) if y > 20 else (x, y + h + 20)
+                cv2.putText(
+                    frame,
+                    emotion_label + track_label,
+                    label_position,
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.5,
+                    (0, 255, 0),
+                    1,
+                    cv2.LINE_AA,
+                )
+            timer.mark("annotate")
+
+        if self.rate_controller is not None:
+            if self.rate_controller.record(timer.stages, self.detector.ran_detection, self.classified, now):
+                self.apply_rates()
+        return frame, emotions, avg_confidence
+
+# Stages timed by an instrumented EmotionDetectionWorker, in order
+WORKER_STAGES = ["read", "resize", "detect", "preprocess", "predict", "aggregate", "annotate", "display", "emit"]
+# Seconds between two stats_signal emissions
+STATS_INTERVAL = 0.5
+
+class DisplayImageConverter:
+    """
+    Turns annotated BGR frames into QImages ready to be painted without
+    conversion, at the largest size with the frame's aspect ratio that fits
+    display_size (width, height). The frame is resized into a reusable buffer and
+    converted to BGRA straight into the memory of a new QImage in Format_RGB32,
+    Qt's native raster format. Each image owns its memory, so it can be handed to
+    the UI thread while the next one is written.
+    """
+    def __init__(self, display_size):
+        self.display_size = tuple(display_size)
+        self.frame_size = None
+        self.size = None
+        self.resized = None
+
+    def fit(self, frame_size):
+        """Returns the size frames of frame_size are shown at."""
+        width, height = frame_size
+        scale = min(self.display_size[0] / width, self.display_size[1] / height)
+        return max(1, int(width * scale)), max(1, int(height * scale))
+
+    def convert(self, frame):
+        frame_size = frame.shape[1::-1]
+        if frame_size != self.frame_size:
+            self.frame_size = frame_size
+            self.size = self.fit(frame_size)
+            self.resized = np.empty((self.size[1], self.size[0], 3), dtype=np.uint8)
+        width, height = self.size
+        if frame_size == self.size:
+            resized = frame
+        else:
+            cv2.resize(frame, self.size, dst=self.resized, interpolation=cv2.INTER_AREA)
+            resized = self.resized
+        image = QImage(width, height, QImage.Format_RGB32)
+        bits = image.bits()
+        bits.setsize(image.byteCount())
+        rows = np.frombuffer(bits, dtype=np.uint8).reshape(height, image.bytesPerLine())
+        cv2.cvtColor(resized, cv2.COLOR_BGR2BGRA, dst=rows[:, :width * 4].reshape(height, width, 4))
+        return image
+
 class EmotionDetectionWorker(QThread):
     """
-    A QThread that continuously captures frames from the camera,
-    detects faces, and estimates emotions.
+    A QThread that detects faces and estimates emotions on the newest camera frame,
+    dropping frames that arrive while inference is busy. Results go out as a ready
+    QImage (image_signal, with display_size), a SharedFrameRing slot (frame_signal)
+    or the frame itself (result_signal); with mailbox, only the newest is kept for
+    take_result() and result_ready announces it.
     """
     result_signal = pyqtSignal(np.ndarray, dict, float)
+    frame_signal = pyqtSignal(int, int, np.ndarray, float)
+    image_signal = pyqtSignal(QImage, np.ndarray, float)
+    result_ready = pyqtSignal()
+    stats_signal = pyqtSignal(dict)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, video_source=None, instrumented=INSTRUMENTATION_ENABLED,
+                 shared_frames=SHARED_FRAMES_ENABLED, display_size=None, mailbox=RESULT_MAILBOX_ENABLED):
         super().__init__(parent)
-        self.video_source = cv2.VideoCapture(0)
-        self.video_source.set(cv2.CAP_PROP_FRAME_WIDTH, 320)
-        self.video_source.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)
+        # Frames come from the shared camera service, or from a source of its own
+        # read on a private capture thread
+        self.video_source = video_source
         self.running = True
         self.class_names = ['Annoyed', 'Happiness', 'Sad', 'Upset']
+        detector = create_face_detector(**PIPELINE_DETECTOR_PARAMS)
+        self.pipeline = EmotionPipeline(self.class_names, detector, rate_controller=create_rate_controller(detector))
+        if video_source is not None:
+            self.capture = FrameCapture(video_source)
+        else:
+            self.capture = camera_service.subscription()
+        self.frames_processed = 0
+        self.pipeline_warm = False
+        # Can be switched at any time; the run loop checks it every frame
+        self.instrumented = instrumented
+        self.stage_timer = StageTimer()
+        self.stage_stats = RollingStageStats(WORKER_STAGES)
+        self.display_converter = DisplayImageConverter(display_size) if display_size is not None else None
+        frame_shape = self.pipeline.frame_size[::-1] + (3,)
+        use_ring = shared_frames and display_size is None
+        self.frame_ring = SharedFrameRing(frame_shape, FRAME_RING_SLOTS) if use_ring else None
+        self.mailbox = LatestFrameSlot() if mailbox else None
+
+    @property
+    def coalesced_results(self):
+        """Number of results overwritten in the mailbox before the UI took them."""
+        return self.mailbox.dropped if self.mailbox is not None else 0
+
+    def frame_counters(self):
+        """
+        Returns the captured, processed and dropped frame counts and the coalesced result count.
+        """
+        return {
+            "captured": self.capture.captured,
+            "processed": self.frames_processed,
+            "dropped": self.capture.dropped,
+            "coalesced": self.coalesced_results,
+        }
+
+    def deliver(self, signal, *result):
+        """Sends a result through signal, or leaves it in the mailbox for take_result()."""
+        if self.mailbox is None:
+            signal.emit(*result)
+        elif self.mailbox.put(result):
+            self.result_ready.emit()
+
+    def take_result(self):
+        """
+        Returns the newest result left in the mailbox, as the tuple of arguments of
+        its signal, or None if there is none. Call it from the UI on result_ready.
+        """
+        if self.mailbox is None:
+            return None
+        _, result = self.mailbox.get(timeout=0)
+        return result
+
+    def stats(self):
+        """
+        Returns the rolling stage statistics merged with the frame counters and,
+        with adaptive rates, the controller's rates and budget under "rates".
+        """
+        stats = self.stage_stats.summary()
+        stats.update(self.frame_counters())
+        if self.pipeline.rate_controller is not None:
+            stats["rates"] = self.pipeline.rate_controller.state()
+        return stats
+
+    def start(self, *args):
+        # Set on the caller's thread: set in run(), it would undo a stop() made
+        # before the thread got going. A worker stopped on navigation is started
+        # again when the page returns
+        self.running = True
+        super().start(*args)
 
     def run(self):
+        if not self.running:
+            return
+        if WARMUP_ENABLED and not self.pipeline_warm:
+            self.pipeline.warm_up()
+            self.pipeline_warm = True
+        self.capture.start()
+        last_stats = time.perf_counter()
         while self.running:
             try:
-                ret, frame = self.video_source.read()
-                if not ret:
+                timer = self.stage_timer if self.instrumented else NULL_TIMER
+                timer.start()
+                _, frame = self.capture.slot.get(timeout=0.5)
+                if frame is None:
+                    if self.capture.finished and not self.capture.slot.has_frame():
+                        break
                     continue
+                # read includes waiting for the capture thread's next frame
+                timer.mark("read")
 
-                # Resize the frame for consistent processing
-                frame = cv2.resize(frame, (320, 240))
-                gray, faces = detect_face(frame)
-                emotions = {}
-                total_confidence = 0
-
-                # Check if we have detected any faces
-                if len(faces) > 0:
-                    for (x, y, w, h) in faces:
-                        # Extract the face region
-                        face_roi_gray = gray[y:y+h, x:x+w]
-                        # Preprocess the face before detection
-                        face_roi_gray = preprocess(face_roi_gray)
-                        idx, conf = detect_emotion(face_roi_gray)
-
-                        emotion_label = self.class_names[idx]
-                        emotions[emotion_label] = emotions.get(emotion_label, 0) + conf
-                        total_confidence += conf
-
-                        # Draw bounding box and label on the frame
-                        cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 1)
-                        label_position = (x, y - 10) if y > 20 else (x, y + h + 20)
-                        cv2.putText(
-                            frame,
-                            emotion_label,
-                            label_position,
-                            cv2.FONT_HERSHEY_SIMPLEX,
-                            0.5,
-                            (0, 255, 0),
-                            1,
-                            cv2.LINE_AA,
-                        )
-                    avg_confidence = total_confidence / len(faces)
+                if self.display_converter is not None:
+                    frame, emotions, avg_confidence = self.pipeline.process(frame, timer)
+                    image = self.display_converter.convert(frame)
+                    timer.mark("display")
+                    self.frames_processed += 1
+                    self.deliver(self.image_signal, image, self.pipeline.probabilities, avg_confidence)
+                elif self.frame_ring is not None:
+                    slot, out = self.frame_ring.reserve()
+                    _, emotions, avg_confidence = self.pipeline.process(frame, timer, out=out)
+                    sequence = self.frame_ring.commit(slot)
+                    self.frames_processed += 1
+                    self.deliver(self.frame_signal, slot, sequence, self.pipeline.probabilities, avg_confidence)
                 else:
-                    avg_confidence = 0
+                    frame, emotions, avg_confidence = self.pipeline.process(frame, timer)
+                    self.frames_processed += 1
+                    self.deliver(self.result_signal, frame, emotions, avg_confidence)
+                timer.mark("emit")
 
-                self.result_signal.emit(frame, emotions, avg_confidence)
+                if timer is not NULL_TIMER:
+                    self.stage_stats.record(timer.stages, timer.last)
+                    if timer.last - last_stats >= STATS_INTERVAL:
+                        last_stats = timer.last
+                        self.stats_signal.emit(self.stats())
 
             except Exception as e:
                 print("Exception in EmotionDetectionWorker run loop:", e)
 
+        self.capture.stop()
+
     def stop(self):
         self.running = False
-        self.video_source.release()
+        self.capture.stop()
+        if self.video_source is not None:
+            self.video_source.release()
+
+    def close(self):
+        """
+        Frees the shared frame ring. Call it after stop() and wait(), once no
+        frame from the ring is displayed any more.
+        """
+        if self.frame_ring is not None:
+            self.frame_ring.close()
+            self.frame_ring = None
@@ -0,0 +1,74 @@
+import numpy as np
+
+
+class EmotionSmoother:
+    """
+    An exponentially weighted emotion probability vector per tracked face, held in
+    fixed-size numpy arrays. A dict maps each track key to its row, so update()
+    costs O(1) per face. The weight of a new prediction comes from the time since
+    the row was last updated, so estimates decay at the same rate whatever the
+    classification rate; the held estimate stays valid between classifications.
+    A row not updated for max_age seconds starts over. When every row is in use
+    the least recently updated one is reused, so at most capacity faces are
+    smoothed independently.
+    """
+    def __init__(self, class_count, half_life=0.5, capacity=16, max_age=2.0):
+        self.half_life = half_life
+        self.capacity = capacity
+        self.max_age = max_age
+        self.probabilities = np.zeros((capacity, class_count), dtype=np.float32)
+        self.updated_at = np.full(capacity, -np.inf)
+        self.rows = {}
+        self.keys = [None] * capacity
+
+    def weight(self, elapsed):
+        """Returns the weight of a prediction made elapsed seconds after the previous one."""
+        if self.half_life <= 0:
+            return 1.0
+        return 1.0 - 0.5 ** (elapsed / self.half_life)
+
+    def row_for(self, key, now):
+        """Returns the row of key and whether it holds no live estimate yet."""
+        row = self.rows.get(key)
+        if row is not None:
+            return row, now - self.updated_at[row] > self.max_age
+        row = int(np.argmin(self.updated_at))
+        if self.keys[row] is not None:
+            del self.rows[self.keys[row]]
+        self.rows[key] = row
+        self.keys[row] = key
+        return row, True
+
+    def update(self, keys, probabilities, now):
+        """
+        Blends the (n, classes) probabilities of the faces with the given track keys
+        into their estimates at time now (seconds). Returns the (n, classes) smoothed
+        probabilities.
+        """
+        rows = np.empty(len(keys), dtype=np.intp)
+        for i, key in enumerate(keys):
+            row, fresh = self.row_for(key, now)
+            if fresh:
+                self.probabilities[row] = probabilities[i]
+            else:
+                weight = self.weight(now - self.updated_at[row])
+                self.probabilities[row] += weight * (probabilities[i] - self.probabilities[row])
+            self.updated_at[row] = now
+            rows[i] = row
+        return self.probabilities[rows]
+
+    def estimate(self, key, now):
+        """
+        Returns the held probability vector of key, or None if it is unknown or
+        older than max_age.
+        """
+        row = self.rows.get(key)
+        if row is None or now - self.updated_at[row] > self.max_age:
+            return None
+        return self.probabilities[row]
+
+    def reset(self):
+        self.probabilities.fill(0)
+        self.updated_at.fill(-np.inf)
+        self.rows.clear()
+        self.keys = [None] * self.capacity
@@ -0,0 +1,171 @@
+import os
+import cv2
+import numpy as np
+from ui.controllers.face_tracking import FaceTracker
+
+# The bundled frontal-face cascades are trained on 24x24 windows
+CASCADE_WINDOW = 24
+# Smallest size, in downscaled pixels, a face of the minimum size is allowed to shrink to
+MIN_SCALED_FACE = int(CASCADE_WINDOW * 1.5)
+
+
+def detection_scale_for(min_size):
+    """
+    Returns the smallest downscale factor at which a face of min_size pixels
+    still spans MIN_SCALED_FACE pixels, so the cascade can find it.
+    """
+    if not min_size:
+        return 1.0
+    return min(1.0, MIN_SCALED_FACE / float(min_size))
+
+
+def resolve_detection_scale(setting, min_size):
+    """
+    Turns a DETECTION_SCALE setting ("auto" or a number) into a scale factor.
+    """
+    if str(setting).lower() == "auto":
+        return detection_scale_for(min_size)
+    return min(1.0, max(0.05, float(setting)))
+
+
+def detect_downscaled(cascade, gray, scale, scale_factor=1.1, min_neighbors=5, min_size=None, max_size=None):
+    """
+    Runs the cascade on a copy of the gray frame downscaled by scale and maps the
+    boxes back to full-resolution coordinates. min_size and max_size are given in
+    full-resolution pixels. Returns an (n, 4) int array of (x, y, w, h).
+    """
+    kwargs = {"scaleFactor": scale_factor, "minNeighbors": min_neighbors}
+    if scale < 1.0:
+        small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    else:
+        scale, small = 1.0, gray
+    if min_size:
+        kwargs["minSize"] = (max(CASCADE_WINDOW, int(min_size * scale)),) * 2
+    if max_size:
+        kwargs["maxSize"] = (int(max_size * scale),) * 2
+
+    faces = cascade.detectMultiScale(small, **kwargs)
+    if len(faces) == 0:
+        return np.empty((0, 4), dtype=int)
+    return np.round(np.asarray(faces) / scale).astype(int)
+
+
+class FaceDetector:
+    """
+    Interface shared by the face detectors.
+    detect() takes a gray frame and returns an (n, 4) int array of (x, y, w, h) boxes.
+    track() runs a full detection only every detect_interval frames;
+    ran_detection tells whether the last track() call did.
+    """
+    name = None
+    detect_interval = 1
+    ran_detection = False
+    held_tracks = None
+    frames_held = 0
+
+    def detect(self, gray):
+        raise NotImplementedError
+
+    def track(self, gray):
+        """
+        Returns [(track_id, box), ...]. Detectors without tracking give None IDs
+        and repeat their last boxes between detections.
+        """
+        if self.held_tracks is not None and self.frames_held < self.detect_interval - 1:
+            self.frames_held += 1
+            self.ran_detection = False
+            return self.held_tracks
+        self.frames_held = 0
+        self.ran_detection = True
+        self.held_tracks = [(None, tuple(int(v) for v in box)) for box in self.detect(gray)]
+        return self.held_tracks
+
+    def set_detect_interval(self, interval):
+        self.detect_interval = max(1, int(interval))
+
+    def reset(self):
+        """Forgets any state carried between frames."""
+        self.held_tracks = None
+        self.frames_held = 0
+
+
+class HaarFaceDetector(FaceDetector):
+    """
+    The Haar Cascade shipped in ui/ml, with tunable parameters.
+    Detection runs on a frame downscaled by detection_scale ("auto" or a number).
+    """
+    name = "haar"
+
+    def __init__(self, cascade_path, scale_factor=1.1, min_neighbors=5, min_size=None, max_size=None,
+                 detection_scale=1.0):
+        self.cascade = cv2.CascadeClassifier(cascade_path)
+        if self.cascade.empty():
+            raise IOError(f"Failed to load Haar Cascade from {cascade_path}")
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.min_size = min_size
+        self.max_size = max_size
+        self.detection_scale = resolve_detection_scale(detection_scale, min_size)
+
+    def detect(self, gray):
+        return detect_downscaled(self.cascade, gray, self.detection_scale, self.scale_factor,
+                                 self.min_neighbors, self.min_size, self.max_size)
+
+
+class BundledCascadeDetector(HaarFaceDetector):
+    """
+    One of the cascades bundled with OpenCV in cv2.data, selected by file name.
+    """
+    name = "bundled"
+
+    def __init__(self, cascade_name="haarcascade_frontalface_alt2.xml", **params):
+        super().__init__(os.path.join(cv2.data.haarcascades, cascade_name), **params)
+
+
+class TrackingFaceDetector(FaceDetector):
+    """
+    Runs another detector only every few frames and follows the faces with a
+    FaceTracker in between, giving each face a stable track ID.
+    """
+    name = "tracking"
+
+    def __init__(self, detector, detect_interval=10, min_confidence=0.6):
+        self.detector = detector
+        self.detect_interval = detect_interval
+        self.min_confidence = min_confidence
+        self.reset()
+
+    def detect(self, gray):
+        tracks = self.track(gray)
+        if not tracks:
+            return np.empty((0, 4), dtype=int)
+        return np.array([box for _, box in tracks], dtype=int)
+
+    def track(self, gray):
+        tracks = self.tracker.update(gray)
+        self.ran_detection = self.tracker.frames_since_detection == 0
+        return tracks
+
+    def set_detect_interval(self, interval):
+        super().set_detect_interval(interval)
+        self.tracker.detect_interval = self.detect_interval
+
+    def reset(self):
+        self.tracker = FaceTracker(self.detector.detect, self.detect_interval, self.min_confidence)
+
+
+def create_detector(name, cascade_path, bundled_cascade="haarcascade_frontalface_alt2.xml",
+                    tracked_detector="haar", detect_interval=10, min_confidence=0.6, **params):
+    """
+    Creates the face detector selected by name: "haar", "bundled" or "tracking".
+    params (scale_factor, min_neighbors, min_size, max_size, detection_scale) go to
+    the cascade; "tracking" wraps the detector named by tracked_detector.
+    """
+    if name == "haar":
+        return HaarFaceDetector(cascade_path, **params)
+    if name == "bundled":
+        return BundledCascadeDetector(bundled_cascade, **params)
+    if name == "tracking":
+        inner = create_detector(tracked_detector, cascade_path, bundled_cascade, **params)
+        return TrackingFaceDetector(inner, detect_interval, min_confidence)
+    raise ValueError(f"Unknown face detector: {name}")
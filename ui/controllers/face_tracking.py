@@ -0,0 +1,105 @@
+import cv2
+import numpy as np
+
+
+def box_iou(a, b):
+    """
+    Returns the intersection-over-union of two (x, y, w, h) boxes.
+    """
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    ix = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    iy = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = ix * iy
+    union = aw * ah + bw * bh - inter
+    return inter / union if union > 0 else 0.0
+
+
+class Track:
+    """
+    A face followed between detections.
+    The template is the gray patch cut at the last full detection.
+    """
+    def __init__(self, track_id, box, template):
+        self.track_id = track_id
+        self.box = box
+        self.template = template
+        self.confidence = 1.0
+
+
+class FaceTracker:
+    """
+    Runs the full face detector every detect_interval frames, or sooner when a
+    track's template match falls below min_confidence, and propagates boxes in
+    between with template matching in a small window around the previous box.
+    Each face keeps a stable track ID across frames.
+    """
+    def __init__(self, detect, detect_interval=10, min_confidence=0.6, search_margin=0.5, match_iou=0.3):
+        self.detect = detect
+        self.detect_interval = detect_interval
+        self.min_confidence = min_confidence
+        self.search_margin = search_margin
+        self.match_iou = match_iou
+        self.tracks = []
+        self.next_id = 0
+        self.frames_since_detection = detect_interval
+        self.detections = 0
+
+    def update(self, gray):
+        """
+        Returns [(track_id, (x, y, w, h)), ...] for the faces in the gray frame.
+        """
+        self.frames_since_detection += 1
+        if self.needs_detection():
+            self.redetect(gray)
+        else:
+            self.propagate(gray)
+        return [(track.track_id, track.box) for track in self.tracks]
+
+    def needs_detection(self):
+        if not self.tracks or self.frames_since_detection >= self.detect_interval:
+            return True
+        return any(track.confidence < self.min_confidence for track in self.tracks)
+
+    def redetect(self, gray):
+        """
+        Runs the full detector and matches detections to existing tracks by IoU,
+        so faces that are still in view keep their IDs.
+        """
+        self.detections += 1
+        self.frames_since_detection = 0
+        unmatched = list(self.tracks)
+        tracks = []
+        for box in self.detect(gray):
+            box = tuple(int(v) for v in box)
+            best = max(unmatched, key=lambda t: box_iou(t.box, box), default=None)
+            x, y, w, h = box
+            template = gray[y:y + h, x:x + w].copy()
+            if best is not None and box_iou(best.box, box) >= self.match_iou:
+                unmatched.remove(best)
+                best.box, best.template, best.confidence = box, template, 1.0
+                tracks.append(best)
+            else:
+                tracks.append(Track(self.next_id, box, template))
+                self.next_id += 1
+        self.tracks = tracks
+
+    def propagate(self, gray):
+        """
+        Moves every track to the best template match near its previous box.
+        """
+        frame_h, frame_w = gray.shape[:2]
+        for track in self.tracks:
+            x, y, w, h = track.box
+            dx, dy = int(w * self.search_margin), int(h * self.search_margin)
+            x0, y0 = max(0, x - dx), max(0, y - dy)
+            x1, y1 = min(frame_w, x + w + dx), min(frame_h, y + h + dy)
+            window = gray[y0:y1, x0:x1]
+            th, tw = track.template.shape[:2]
+            if window.shape[0] < th or window.shape[1] < tw:
+                track.confidence = 0.0
+                continue
+            scores = cv2.matchTemplate(window, track.template, cv2.TM_CCOEFF_NORMED)
+            _, confidence, _, (mx, my) = cv2.minMaxLoc(scores)
+            track.confidence = float(np.nan_to_num(confidence))
+            track.box = (x0 + mx, y0 + my, w, h)
@@ -0,0 +1,90 @@
+import threading
+import time
+
+
+class LatestFrameSlot:
+    """
+    A single-slot handoff between the capture and inference stages.
+    put() always overwrites the held frame, so a slow consumer skips stale
+    frames instead of queueing them. Overwritten frames are counted as dropped.
+    """
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.frame = None
+        self.sequence = 0
+        self.taken_sequence = 0
+        self.dropped = 0
+
+    def put(self, frame):
+        """Returns True if the slot held no untaken frame, i.e. nothing was overwritten."""
+        with self.condition:
+            overwritten = self.sequence > self.taken_sequence
+            if overwritten:
+                self.dropped += 1
+            self.frame = frame
+            self.sequence += 1
+            self.condition.notify()
+            return not overwritten
+
+    def has_frame(self):
+        """Returns True when a frame newer than the last one taken is waiting."""
+        with self.condition:
+            return self.sequence > self.taken_sequence
+
+    def get(self, timeout=None):
+        """
+        Waits for a frame newer than the last one taken.
+        Returns (sequence, frame), or (None, None) on timeout.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.sequence > self.taken_sequence, timeout):
+                return None, None
+            self.taken_sequence = self.sequence
+            frame, self.frame = self.frame, None
+            return self.sequence, frame
+
+
+class FrameCapture:
+    """
+    Reads frames from a video source on a dedicated thread and hands only the
+    newest one to the inference stage through a LatestFrameSlot.
+    """
+    def __init__(self, video_source):
+        self.video_source = video_source
+        self.slot = LatestFrameSlot()
+        self.captured = 0
+        self.failed_reads = 0
+        self.finished = False
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="FrameCapture", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while self.running:
+            ret, frame = self.video_source.read()
+            if not ret:
+                if getattr(self.video_source, "exhausted", False):
+                    # A recorded or synthetic source has run out of frames
+                    self.finished = True
+                    break
+                self.failed_reads += 1
+                time.sleep(0.01)
+                continue
+            self.captured += 1
+            self.slot.put(frame)
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+    @property
+    def dropped(self):
+        return self.slot.dropped
@@ -0,0 +1,91 @@
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+
+class SharedFrameRing:
+    """
+    A ring of fixed-size uint8 frame slots in one multiprocessing.shared_memory
+    block, so frames pass between threads or processes as a slot index and a
+    sequence number instead of as copies.
+
+    The producer reserve()s the next slot, writes the frame straight into the
+    returned view and commit()s it, which publishes a new sequence number for the
+    slot; a slot's sequence is -1 while it is being written. A consumer given
+    (slot, sequence) reads the view from frame() and checks is_current() once it
+    is done with it: a mismatch means the producer lapped the ring meanwhile and
+    the frame was overwritten.
+
+    The creating side owns the block and unlinks it in close(); other processes
+    attach() to it by name.
+    """
+    def __init__(self, shape, slots=4, name=None, create=True):
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.owner = create
+        frame_bytes = int(np.prod(self.shape))
+        size = slots * (8 + frame_bytes)
+        if create:
+            self.memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+            # Attaching registers the block with this process's resource tracker,
+            # which would unlink it when this process exits; the owner does that
+            resource_tracker.unregister(self.memory._name, "shared_memory")
+        self.sequences = np.ndarray((slots,), dtype=np.int64, buffer=self.memory.buf)
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.memory.buf, offset=slots * 8)
+        if create:
+            self.sequences.fill(0)
+        self.next_slot = 0
+        self.sequence = 0
+
+    @classmethod
+    def attach(cls, name, shape, slots=4):
+        """Opens a ring created by another process."""
+        return cls(shape, slots, name=name, create=False)
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def reserve(self):
+        """
+        Claims the next slot for writing. Returns (slot, view of the slot).
+        """
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % self.slots
+        self.sequences[slot] = -1
+        return slot, self.frames[slot]
+
+    def commit(self, slot):
+        """Publishes the frame written into slot. Returns its sequence number."""
+        self.sequence += 1
+        self.sequences[slot] = self.sequence
+        return self.sequence
+
+    def write(self, frame):
+        """Copies a frame into the next slot. Returns (slot, sequence)."""
+        slot, view = self.reserve()
+        np.copyto(view, frame)
+        return slot, self.commit(slot)
+
+    def frame(self, slot, sequence):
+        """
+        Returns a view of the frame published as (slot, sequence), or None if
+        the slot has been reused since.
+        """
+        if self.sequences[slot] != sequence:
+            return None
+        return self.frames[slot]
+
+    def is_current(self, slot, sequence):
+        return self.sequences[slot] == sequence
+
+    def close(self):
+        # The numpy views export the buffer; they must go before it is closed
+        self.frames = self.sequences = None
+        try:
+            self.memory.close()
+            if self.owner:
+                self.memory.unlink()
+        except (BufferError, FileNotFoundError) as e:
+            print(f"Error closing shared frame ring: {e}")
@@ -0,0 +1,181 @@
+import os
+import time
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+# Pacing modes: "realtime" delivers frames at the source frame rate,
+# "fast" delivers them as fast as the consumer reads
+REALTIME = "realtime"
+FAST = "fast"
+
+
+class FrameSource:
+    """
+    Base class of the frame sources. It follows the cv2.VideoCapture calls the
+    pipeline uses (read, isOpened, release), so a source can stand in for a camera.
+    In realtime pacing, read() waits until the next frame is due at fps.
+    exhausted turns True once a finite source has delivered its last frame.
+    """
+    def __init__(self, fps=30.0, pacing=REALTIME):
+        self.fps = fps
+        self.pacing = pacing
+        self.exhausted = False
+        self.next_due = None
+
+    def next_frame(self):
+        raise NotImplementedError
+
+    def read(self):
+        ret, frame = self.next_frame()
+        if not ret:
+            return False, None
+        if self.pacing == REALTIME and self.fps:
+            now = time.perf_counter()
+            if self.next_due is None or now - self.next_due > 1.0:
+                self.next_due = now
+            elif self.next_due > now:
+                time.sleep(self.next_due - now)
+            self.next_due += 1.0 / self.fps
+        return True, frame
+
+    def isOpened(self):
+        return not self.exhausted
+
+    def release(self):
+        self.exhausted = True
+
+
+class CameraSource(FrameSource):
+    """
+    A live camera. The device paces the frames, so no extra pacing is applied.
+    """
+    def __init__(self, index=0, width=None, height=None):
+        super().__init__(fps=None, pacing=FAST)
+        self.capture = cv2.VideoCapture(index)
+        if width:
+            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        if height:
+            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+    def next_frame(self):
+        return self.capture.read()
+
+    def isOpened(self):
+        return self.capture.isOpened()
+
+    def release(self):
+        super().release()
+        self.capture.release()
+
+
+class VideoFileSource(FrameSource):
+    """
+    A recorded clip, paced at the clip's own frame rate in realtime mode.
+    """
+    def __init__(self, path, pacing=REALTIME, loop=False):
+        self.capture = cv2.VideoCapture(path)
+        if not self.capture.isOpened():
+            raise IOError(f"Unable to open video file: {path}")
+        super().__init__(fps=self.capture.get(cv2.CAP_PROP_FPS) or 30.0, pacing=pacing)
+        self.loop = loop
+
+    def next_frame(self):
+        ret, frame = self.capture.read()
+        if not ret and self.loop:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.capture.read()
+        if not ret:
+            self.exhausted = True
+        return ret, frame
+
+    def release(self):
+        super().release()
+        self.capture.release()
+
+
+class ImageDirectorySource(FrameSource):
+    """
+    The images of a directory in file name order, one per frame.
+    """
+    def __init__(self, path, fps=30.0, pacing=REALTIME, loop=False):
+        super().__init__(fps=fps, pacing=pacing)
+        self.paths = [
+            os.path.join(path, name) for name in sorted(os.listdir(path))
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+        if not self.paths:
+            raise IOError(f"No images found in: {path}")
+        self.loop = loop
+        self.position = 0
+
+    def next_frame(self):
+        if self.position >= len(self.paths):
+            if not self.loop:
+                self.exhausted = True
+                return False, None
+            self.position = 0
+        frame = cv2.imread(self.paths[self.position])
+        self.position += 1
+        return frame is not None, frame
+
+
+class SyntheticSource(FrameSource):
+    """
+    Deterministic generated frames: a textured background with face-like
+    patterns that drift slowly, seeded so every run sees identical pixels.
+    frame_count of None generates frames forever.
+    """
+    def __init__(self, width=320, height=240, faces=1, frame_count=None, seed=0, fps=30.0, pacing=REALTIME):
+        super().__init__(fps=fps, pacing=pacing)
+        self.width = width
+        self.height = height
+        self.faces = faces
+        self.frame_count = frame_count
+        self.index = 0
+        rng = np.random.default_rng(seed)
+        self.background = cv2.GaussianBlur(
+            rng.integers(60, 200, (height, width, 3), dtype=np.uint8), (0, 0), 3
+        )
+        self.phases = rng.random(faces) * 2 * np.pi
+
+    def face_boxes(self, index):
+        """Returns the (x, y, w, h) box of every face pattern in frame index."""
+        size = max(24, min(self.width // max(1, self.faces) - 8, self.height // 2))
+        boxes = []
+        for i in range(self.faces):
+            slot = self.width / self.faces
+            x = int(slot * i + (slot - size) / 2 + 4 * np.sin(index / 15 + self.phases[i]))
+            y = int((self.height - size) / 2 + 4 * np.cos(index / 20 + self.phases[i]))
+            boxes.append((max(0, x), max(0, y), size, size))
+        return boxes
+
+    def next_frame(self):
+        if self.frame_count is not None and self.index >= self.frame_count:
+            self.exhausted = True
+            return False, None
+        frame = self.background.copy()
+        for (x, y, w, h) in self.face_boxes(self.index):
+            center, axes = (x + w // 2, y + h // 2), (w * 2 // 5, h // 2)
+            cv2.ellipse(frame, center, axes, 0, 0, 360, (170, 190, 220), -1)
+            for eye_x in (x + w // 3, x + 2 * w // 3):
+                cv2.circle(frame, (eye_x, y + h * 2 // 5), max(2, w // 14), (40, 40, 40), -1)
+            cv2.ellipse(frame, (x + w // 2, y + h * 7 // 10), (w // 6, h // 14), 0, 0, 180, (60, 50, 120), 2)
+        self.index += 1
+        return True, frame
+
+
+def open_frame_source(kind, path=None, width=None, height=None, pacing=REALTIME, camera_index=0, loop=False):
+    """
+    Creates the frame source selected by kind: "camera", "video", "images" or "synthetic".
+    """
+    if kind == "camera":
+        return CameraSource(camera_index, width, height)
+    if kind == "video":
+        return VideoFileSource(path, pacing=pacing, loop=loop)
+    if kind == "images":
+        return ImageDirectorySource(path, pacing=pacing, loop=loop)
+    if kind == "synthetic":
+        return SyntheticSource(width or 320, height or 240, pacing=pacing)
+    raise ValueError(f"Unknown frame source: {kind}")
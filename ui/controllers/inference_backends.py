@@ -0,0 +1,128 @@
+import numpy as np
+import tensorflow as tf
+from ui.utils.thread_budget import apply_tensorflow_threads
+
+INPUT_SHAPE = (48, 48, 3)
+
+
+def build_inference_fn(keras_model):
+    """
+    Wraps the model in a tf.function with a fixed input signature and traces it once.
+    Calling the result skips the data adapter and callback setup that model.predict
+    repeats on every call, which dominates the cost of small real-time batches.
+    """
+    @tf.function(input_signature=[tf.TensorSpec(shape=(None,) + INPUT_SHAPE, dtype=tf.float32)])
+    def infer(batch):
+        return keras_model(batch, training=False)
+
+    infer.get_concrete_function()
+    return infer
+
+
+class KerasBackend:
+    """
+    Runs the Keras model through a traced inference callable.
+    """
+    name = "keras"
+
+    def __init__(self, model_path):
+        self.model = tf.keras.models.load_model(model_path)
+        self.infer = build_inference_fn(self.model)
+
+    def predict(self, batch):
+        """Returns the class probabilities for a float32 NHWC batch."""
+        return self.infer(batch).numpy()
+
+
+class TFLiteBackend:
+    """
+    Runs a .tflite flatbuffer in the TFLite interpreter, pinned to a fixed thread count.
+    One interpreter is kept per batch size, so switching between face counts does
+    not reallocate tensors once every size has been seen (or warmed up).
+    """
+    name = "tflite"
+
+    def __init__(self, model_path, num_threads=None):
+        with open(model_path, "rb") as file:
+            self.model_content = file.read()
+        self.num_threads = num_threads
+        self.interpreters = {}
+        self.interpreter_for(1)
+
+    def interpreter_for(self, batch_size):
+        """
+        Returns (interpreter, input index, output index) allocated for batch_size,
+        creating the interpreter on first use.
+        """
+        entry = self.interpreters.get(batch_size)
+        if entry is None:
+            interpreter = tf.lite.Interpreter(model_content=self.model_content, num_threads=self.num_threads)
+            input_index = interpreter.get_input_details()[0]["index"]
+            interpreter.resize_tensor_input(input_index, (batch_size,) + INPUT_SHAPE)
+            interpreter.allocate_tensors()
+            entry = (interpreter, input_index, interpreter.get_output_details()[0]["index"])
+            self.interpreters[batch_size] = entry
+        return entry
+
+    def predict(self, batch):
+        """Returns the class probabilities for a float32 NHWC batch."""
+        interpreter, input_index, output_index = self.interpreter_for(batch.shape[0])
+        interpreter.set_tensor(input_index, batch)
+        interpreter.invoke()
+        return interpreter.get_tensor(output_index)
+
+
+def warm_up(backend, max_batch_size, rounds=2):
+    """
+    Runs synthetic batches of every size from 1 to max_batch_size through the backend,
+    so tracing, allocation and kernel selection happen before the first real frame.
+    """
+    for batch_size in range(1, max_batch_size + 1):
+        batch = np.zeros((batch_size,) + INPUT_SHAPE, dtype=np.float32)
+        for _ in range(rounds):
+            backend.predict(batch)
+
+
+def load_backend(name, keras_path, tflite_path, num_threads=None):
+    """
+    Creates the inference backend selected by name ("keras" or "tflite").
+    TensorFlow's thread pools are sized from the thread budget first.
+    """
+    apply_tensorflow_threads()
+    if name == "keras":
+        return KerasBackend(keras_path)
+    if name == "tflite":
+        return TFLiteBackend(tflite_path, num_threads=num_threads)
+    raise ValueError(f"Unknown inference backend: {name}")
+
+
+def export_tflite(keras_path, tflite_path, quantization=None, representative_images=None):
+    """
+    Converts the Keras model at keras_path to a .tflite flatbuffer at tflite_path.
+    quantization is None for float32, "fp16" for float16 weights, or "int8" for
+    full integer quantization calibrated on representative_images (float32 NHWC).
+    Input and output stay float32 so every variant fits TFLiteBackend unchanged.
+    Returns the size of the written file in bytes.
+    """
+    model = tf.keras.models.load_model(keras_path)
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if quantization == "fp16":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == "int8":
+        if representative_images is None:
+            raise ValueError("int8 quantization needs representative_images for calibration")
+
+        def representative_dataset():
+            for image in representative_images:
+                yield [image[np.newaxis].astype(np.float32)]
+
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    elif quantization is not None:
+        raise ValueError(f"Unknown quantization: {quantization}")
+    flatbuffer = converter.convert()
+    with open(tflite_path, "wb") as file:
+        file.write(flatbuffer)
+    return len(flatbuffer)
@@ -0,0 +1,83 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# The backend loaded by a pool process and the barrier its readiness check waits
+# on; set by load_process_backend
+process_backend = None
+ready_barrier = None
+# Seconds a process waits in process_ready for the others to load the model
+READY_TIMEOUT = 300
+
+
+def load_process_backend(backend_name, keras_path, tflite_path, num_threads, warm_up_batch_size, barrier):
+    """
+    Runs once in every pool process: loads the emotion model and warms it up.
+    """
+    global process_backend, ready_barrier
+    ready_barrier = barrier
+    from ui.controllers.inference_backends import load_backend, warm_up
+    process_backend = load_backend(backend_name, keras_path, tflite_path, num_threads=num_threads)
+    if warm_up_batch_size:
+        warm_up(process_backend, warm_up_batch_size)
+
+
+def process_ready():
+    """
+    Waits until every pool process runs this, so each of them must have loaded the
+    model; a process that is done cannot take another process's check.
+    """
+    ready_barrier.wait(timeout=READY_TIMEOUT)
+    return os.getpid()
+
+
+def predict_in_process(batch):
+    return process_backend.predict(batch)
+
+
+class InferenceService:
+    """
+    A fixed pool of worker processes that each load the emotion model once and
+    classify face batches submitted from any thread, so several sessions in one
+    application share the model and run inference outside the GIL.
+    It has the predict() of the inference backends and stands in for one.
+    Processes are spawned, not forked, so TensorFlow starts clean in each.
+    """
+    name = "process-pool"
+
+    def __init__(self, backend_name, keras_path, tflite_path, num_threads=None, processes=2,
+                 warm_up_batch_size=0):
+        self.processes = processes
+        context = multiprocessing.get_context("spawn")
+        # Shared with the processes when they are started; it cannot be sent with a task
+        barrier = context.Barrier(processes)
+        self.executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=context,
+            initializer=load_process_backend,
+            initargs=(backend_name, keras_path, tflite_path, num_threads, warm_up_batch_size, barrier),
+        )
+
+    def start(self):
+        """
+        Starts every process and blocks until each has loaded the model.
+        Returns the process IDs.
+        """
+        futures = [self.executor.submit(process_ready) for _ in range(self.processes)]
+        return sorted({future.result() for future in futures})
+
+    def submit(self, batch):
+        """
+        Queues a float32 NHWC batch. Returns a Future of its class probabilities.
+        """
+        # The batch is pickled later on the executor's feeder thread, so copy it
+        # now; callers usually pass a view of a buffer the next frame overwrites
+        return self.executor.submit(predict_in_process, np.array(batch, dtype=np.float32))
+
+    def predict(self, batch):
+        """Returns the class probabilities for a float32 NHWC batch."""
+        return self.submit(batch).result()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
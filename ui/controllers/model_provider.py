@@ -0,0 +1,88 @@
+import threading
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+# Readiness states published through state_changed
+IDLE = "idle"
+LOADING = "loading"
+WARMING_UP = "warming_up"
+READY = "ready"
+FAILED = "failed"
+
+
+class ModelProvider(QObject):
+    """
+    Loads heavy resources (TensorFlow, the emotion model, the Haar Cascade) on a
+    background thread so windows can paint before they are available.
+    The loader is a function returning a dict of named resources; the optional
+    warm_up function is then called with that dict before the provider is ready.
+    ready is emitted once everything is loaded; failed carries the error message.
+    state_changed publishes every step: loading, warming_up, ready or failed.
+    """
+    ready = pyqtSignal()
+    failed = pyqtSignal(str)
+    state_changed = pyqtSignal(str)
+
+    def __init__(self, loader, warm_up=None, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self.warm_up = warm_up
+        self.state = IDLE
+        self.resources = None
+        self.error = None
+        self.loaded = threading.Event()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def start_loading(self):
+        """
+        Starts loading in the background. Calling it again is a no-op.
+        """
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.thread = threading.Thread(target=self.load, name="ModelProvider", daemon=True)
+            self.thread.start()
+
+    def set_state(self, state):
+        self.state = state
+        self.state_changed.emit(state)
+
+    def load(self):
+        try:
+            self.set_state(LOADING)
+            resources = self.loader()
+            if self.warm_up is not None:
+                self.set_state(WARMING_UP)
+                self.warm_up(resources)
+            self.resources = resources
+        except Exception as e:
+            self.error = str(e)
+            print(f"Error loading models: {e}")
+        finally:
+            self.loaded.set()
+        if self.error is None:
+            self.set_state(READY)
+            self.ready.emit()
+        else:
+            self.set_state(FAILED)
+            self.failed.emit(self.error)
+
+    def is_ready(self):
+        return self.loaded.is_set() and self.error is None
+
+    def wait(self, timeout=None):
+        """
+        Starts loading if needed and blocks until it finishes.
+        Returns True when the resources are available.
+        """
+        self.start_loading()
+        return self.loaded.wait(timeout) and self.error is None
+
+    def get(self, name):
+        """
+        Returns a loaded resource, blocking until loading has finished.
+        """
+        if not self.wait():
+            raise RuntimeError(f"Models are unavailable: {self.error}")
+        return self.resources[name]
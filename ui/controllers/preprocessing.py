@@ -0,0 +1,38 @@
+import cv2
+import numpy as np
+
+FACE_SIZE = (48, 48)
+
+
+class FaceBatchBuffer:
+    """
+    A reusable float32 NHWC batch the face crops of a frame are written straight into.
+    Each gray ROI is resized into a preallocated uint8 scratch image with
+    cv2.resize(dst=...) and copied, broadcast to the three channels the model
+    expects, into its batch slot; the batch is then scaled to [0, 1] in place.
+    No per-face arrays are allocated. The returned batch is a view that the
+    next fill() overwrites.
+    """
+    def __init__(self, capacity=5):
+        self.scale = np.float32(1.0 / 255.0)
+        self.scratch = np.empty(FACE_SIZE[::-1], dtype=np.uint8)
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        self.capacity = capacity
+        self.batch = np.zeros((capacity,) + FACE_SIZE[::-1] + (3,), dtype=np.float32)
+
+    def fill(self, gray, boxes):
+        """
+        Writes the (x, y, w, h) crops of the gray frame into the batch.
+        Returns a view of the first len(boxes) entries.
+        """
+        count = len(boxes)
+        if count > self.capacity:
+            self.allocate(count)
+        for i, (x, y, w, h) in enumerate(boxes):
+            cv2.resize(gray[y:y + h, x:x + w], FACE_SIZE, dst=self.scratch)
+            np.copyto(self.batch[i], self.scratch[..., np.newaxis], casting="unsafe")
+        batch = self.batch[:count]
+        np.multiply(batch, self.scale, out=batch)
+        return batch
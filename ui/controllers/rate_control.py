@@ -0,0 +1,117 @@
+# Rate levels from richest to leanest: (detection interval multiplier, classification interval).
+# The detection multiplier scales the detector's configured interval.
+LEVELS = [(1, 1), (1, 2), (2, 2), (2, 3), (3, 4), (4, 6), (6, 8), (8, 12)]
+
+
+def ewma(current, sample, alpha):
+    return sample if current is None else current + alpha * (sample - current)
+
+
+class InferenceRateController:
+    """
+    Chooses how often the emotion pipeline runs full face detection and emotion
+    classification so that its per-frame processing cost fits a budget; every
+    frame is still tracked, annotated and shown.
+
+    The budget is a target FPS (at most 1/target_fps seconds of work per frame)
+    and/or a CPU budget in cores (work per frame at most cpu_budget times the
+    frame interval). The controller keeps moving averages of three costs:
+    the work done on every frame, a full detection and a classification pass.
+    Every evaluate_every frames it predicts the cost per frame of the neighbouring
+    levels and moves one level leaner when over budget, or one level richer when
+    that level would still leave headroom.
+    """
+    def __init__(self, target_fps=0, cpu_budget=0, base_detect_interval=1, evaluate_every=15,
+                 headroom=0.8, alpha=0.1):
+        self.target_fps = target_fps
+        self.cpu_budget = cpu_budget
+        self.base_detect_interval = max(1, base_detect_interval)
+        self.evaluate_every = evaluate_every
+        self.headroom = headroom
+        self.alpha = alpha
+        self.level = 0
+        self.frames = 0
+        self.base_cost = None
+        self.detect_cost = None
+        self.classify_cost = None
+        self.frame_interval = None
+        self.last_frame_time = None
+
+    @property
+    def detect_interval(self):
+        return self.base_detect_interval * LEVELS[self.level][0]
+
+    @property
+    def classify_interval(self):
+        return LEVELS[self.level][1]
+
+    def budget(self):
+        """Returns the allowed seconds of work per frame, or None before it is known."""
+        budgets = []
+        if self.target_fps > 0:
+            budgets.append(1.0 / self.target_fps)
+        if self.cpu_budget > 0 and self.frame_interval is not None:
+            budgets.append(self.cpu_budget * self.frame_interval)
+        return min(budgets) if budgets else None
+
+    def predicted_cost(self, level):
+        """Returns the expected seconds of work per frame at a level."""
+        detect_multiplier, classify_interval = LEVELS[level]
+        cost = self.base_cost or 0.0
+        if self.detect_cost is not None:
+            cost += self.detect_cost / (self.base_detect_interval * detect_multiplier)
+        if self.classify_cost is not None:
+            cost += self.classify_cost / classify_interval
+        return cost
+
+    def record(self, stages, detected, classified, now):
+        """
+        Adds the stage durations of one processed frame. detected and classified
+        tell whether full detection and classification ran on it.
+        Returns True when the rates changed.
+        """
+        if self.last_frame_time is not None:
+            self.frame_interval = ewma(self.frame_interval, now - self.last_frame_time, self.alpha)
+        self.last_frame_time = now
+
+        base = stages.get("resize", 0.0) + stages.get("aggregate", 0.0) + stages.get("annotate", 0.0)
+        if detected:
+            self.detect_cost = ewma(self.detect_cost, stages.get("detect", 0.0), self.alpha)
+        else:
+            base += stages.get("detect", 0.0)
+        if classified:
+            self.classify_cost = ewma(self.classify_cost,
+                                      stages.get("preprocess", 0.0) + stages.get("predict", 0.0), self.alpha)
+        self.base_cost = ewma(self.base_cost, base, self.alpha)
+
+        self.frames += 1
+        if self.frames % self.evaluate_every != 0:
+            return False
+        return self.evaluate()
+
+    def evaluate(self):
+        budget = self.budget()
+        if budget is None:
+            return False
+        if self.predicted_cost(self.level) > budget and self.level < len(LEVELS) - 1:
+            self.level += 1
+            return True
+        if self.level > 0 and self.predicted_cost(self.level - 1) < budget * self.headroom:
+            self.level -= 1
+            return True
+        return False
+
+    def state(self):
+        """Returns the chosen rates and the budget, for the instrumentation."""
+        budget = self.budget()
+        fps = 1.0 / self.frame_interval if self.frame_interval else 0.0
+        return {
+            "target_fps": self.target_fps,
+            "cpu_budget": self.cpu_budget,
+            "budget_ms": budget * 1000 if budget is not None else None,
+            "predicted_ms": self.predicted_cost(self.level) * 1000,
+            "detect_interval": self.detect_interval,
+            "classify_interval": self.classify_interval,
+            "detect_rate": fps / self.detect_interval,
+            "classify_rate": fps / self.classify_interval,
+        }
@@ -3,7 +3,7 @@ import cv2
 from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QVBoxLayout, QWidget
 from PyQt5.QtGui import QImage, QPixmap
 from PyQt5.QtCore import QTimer
-from ui.controllers.emotion_recognition import detect_face, detect_emotion, preprocess
+from ui.controllers.emotion_recognition import detect_face, detect_emotions, preprocess
 
 class VideoWindow(QMainWindow):
     def __init__(self):
@@ -34,11 +34,11 @@ class VideoWindow(QMainWindow):
         if ret:
             gray, faces = detect_face(frame)
 
-            for (x, y, w, h) in faces:
+            faces_p = [preprocess(gray[y:y + h, x:x + w]) for (x, y, w, h) in faces]
+            predictions = detect_emotions(faces_p)
+
+            for (x, y, w, h), (idx, conf) in zip(faces, predictions):
                 cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 0), 2)
-                face_roi_gray = gray[y:y + h, x:x + w]
-                face_roi_gray = preprocess(face_roi_gray)
-                idx, conf = detect_emotion(face_roi_gray)
 
                 class_name = self.class_names[idx]
 
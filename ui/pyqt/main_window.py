@@ -244,7 +244,9 @@ class MainWindow(QMainWindow):
     def show_emotion_session_sad(self):
         self.navigate_to(self.emotion_session_sad)
 
-    def show_video_window(self):
+    def show_video_window(self, emotion_window_seconds=None):
+        """Start a session on the camera dashboard; see its start_session()."""
+        self.video_window.start_session(emotion_window_seconds)
         self.navigate_to(self.video_window)
 
     def show_emotion_session_annoyed(self):
@@ -2,7 +2,11 @@ import sys
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QSpacerItem, QSizePolicy
 from PyQt5.QtGui import QFont, QPixmap, QPainter, QColor, QPen, QFontMetrics
 from PyQt5.QtCore import Qt, QRectF
+from ui.controllers.emotion_aggregation import combine_summaries
 import os
+
+# Windows listed in the session timeline, the most recent ones
+TIMELINE_WINDOWS = 6
 class CustomButton(QPushButton):
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
@@ -196,9 +200,12 @@ class OverviewScreen(QWidget):
             ("Annoyed:", "1%", "#FFC107")
         ]
 
+        # Filled in from the session by show_session
+        self.percentage_labels = {}
         for label, value, color in percentages:
             row = QHBoxLayout()
             text = QLabel(f"{label} {value}")
+            self.percentage_labels[label.rstrip(":")] = text
             text.setFont(QFont('Arial', 22, QFont.Bold))  # Increased font size by 20%
             text.setStyleSheet(f"color: {color};")
             row.addWidget(text)
@@ -211,6 +218,7 @@ class OverviewScreen(QWidget):
         confidence_layout = QVBoxLayout()
         confidence_layout.addStretch(1)
         confidence_text = QLabel("Confidence: 78%")
+        self.confidence_text = confidence_text
         confidence_text.setFont(QFont('Arial', 29, QFont.Bold))  # Increased font size by 20%
         confidence_text.setStyleSheet("color: black;")
         confidence_text.setAlignment(Qt.AlignCenter)
@@ -218,8 +226,12 @@ class OverviewScreen(QWidget):
         confidence_layout.addStretch(1)
         percentages_layout.addLayout(confidence_layout)
 
-        # Right side: empty space to balance the layout
+        # Right side: the dominant emotion of each window of the session
         right_layout = QVBoxLayout()
+        self.timeline_text = QLabel("")
+        self.timeline_text.setFont(QFont('Arial', 16))
+        self.timeline_text.setStyleSheet("color: black;")
+        right_layout.addWidget(self.timeline_text)
         percentages_layout.addLayout(right_layout)
 
         content_layout.addWidget(percentages_widget)
@@ -233,6 +245,26 @@ class OverviewScreen(QWidget):
         help_layout.setContentsMargins(20, 0, 0, 20)
         main_layout.addLayout(help_layout)
 
+    def show_session(self, summaries):
+        """
+        Shows a session from its per-window summaries (EmotionWindow.summaries()):
+        the percentages and confidence over the whole session, and the dominant
+        emotion of its last windows. A session without faces shows zeros.
+        """
+        session = combine_summaries(summaries)
+        if session is None or not session["faces"]:
+            for emotion, text in self.percentage_labels.items():
+                text.setText(f"{emotion}: 0%")
+            self.confidence_text.setText("Confidence: 0%")
+            self.timeline_text.setText("No faces were seen")
+            return
+        for emotion, text in self.percentage_labels.items():
+            text.setText(f"{emotion}: {round(session['percentages'].get(emotion, 0))}%")
+        self.confidence_text.setText(f"Confidence: {round(session['confidence'] * 100)}%")
+        lines = [f"{summary['start']:.0f}-{summary['end']:.0f} s: {summary['dominant'] or '-'}"
+                 for summary in summaries[-TIMELINE_WINDOWS:]]
+        self.timeline_text.setText("\n".join(lines))
+
     def go_to_history(self):
         """Navigate to the History page (p10) in the main window."""
         if self.parent:
@@ -1,12 +1,14 @@
 import sys
-from collections import deque
-import cv2
-import numpy as np
+import time
 from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-                             QFrame, QSizePolicy, QGraphicsDropShadowEffect, QProgressBar)
-from PyQt5.QtGui import QFont, QPixmap, QImage, QColor, QPainter, QLinearGradient
-from PyQt5.QtCore import Qt, QPoint, QPropertyAnimation, QTimer
-from ui.controllers.emotion_recognition import detect_emotion, preprocess, EmotionDetectionWorker
+                             QFrame, QSizePolicy, QGraphicsDropShadowEffect, QProgressBar, QShortcut)
+from PyQt5.QtGui import QFont, QPixmap, QColor, QPainter, QLinearGradient, QKeySequence, QImage
+from PyQt5.QtCore import Qt, QPoint, QRect, QSize, QPropertyAnimation, QTimer
+from ui.controllers.emotion_recognition import EmotionDetectionWorker, model_provider, WORKER_STAGES
+from ui.controllers.model_provider import LOADING, WARMING_UP
+from ui.controllers.emotion_aggregation import EmotionWindow
+from ui.utils.runtime_config import (INSTRUMENTATION_ENABLED, EMOTION_WINDOW_SECONDS, METRICS_REFRESH_FPS,
+                                     SHARED_FRAMES_ENABLED)
 import os
 
 # Tested and working
@@ -68,81 +70,186 @@ class RoundedFrame(QFrame):
         self.setGraphicsEffect(shadow)
 
 
+class VideoWidget(QWidget):
+    """
+    Shows the worker's video frames by painting them in paintEvent. Frames
+    arrive either as QImages already converted and sized for display, or as
+    slots of the worker's shared frame ring, which are painted straight from the
+    slot, scaled by the painter, without being copied. The widget takes the
+    size of the image, centred in bounds, and is opaque, so a new frame repaints
+    only the image without involving the layout or the widgets underneath.
+    """
+    def __init__(self, bounds, parent=None):
+        super().__init__(parent)
+        self.bounds = QRect(bounds)
+        self.image = None
+        self.ring_frame = None
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setGeometry(self.bounds)
+        self.hide()
+
+    def set_image(self, image):
+        self.image = image
+        self.ring_frame = None
+        self.show_size(image.size())
+
+    def set_ring_frame(self, ring, slot, sequence):
+        """Shows the frame published in ring as (slot, sequence)."""
+        self.image = None
+        self.ring_frame = (ring, slot, sequence)
+        height, width = ring.shape[:2]
+        self.show_size(QSize(width, height).scaled(self.bounds.size(), Qt.KeepAspectRatio))
+
+    def clear(self):
+        """Forgets the current frame, e.g. before the ring it is in is freed."""
+        self.image = self.ring_frame = None
+
+    def show_size(self, size):
+        if size != self.size():
+            rect = QRect(QPoint(0, 0), size)
+            rect.moveCenter(self.bounds.center())
+            self.setGeometry(rect)
+        if self.isHidden():
+            self.show()
+        self.update()
+
+    def paintEvent(self, event):
+        if self.image is not None:
+            painter = QPainter(self)
+            painter.drawImage(0, 0, self.image)
+        elif self.ring_frame is not None:
+            ring, slot, sequence = self.ring_frame
+            frame = ring.frame(slot, sequence)
+            # A slot the worker has already reused is skipped; a newer frame is on its way
+            if frame is not None:
+                height, width = frame.shape[:2]
+                image = QImage(frame.data, width, height, frame.strides[0], QImage.Format_BGR888)
+                painter = QPainter(self)
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter.drawImage(self.rect(), image)
+
+
+class DeveloperOverlay(QLabel):
+    """
+    A translucent panel over the dashboard showing the emotion worker's live FPS,
+    per-stage latencies and frame counters, fed by the worker's stats_signal.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet("""
+          background-color: rgba(0, 0, 0, 170);
+          color: #E0FFE0;
+          border-radius: 8px;
+          padding: 8px;
+      """)
+        self.setFont(QFont("Courier", 10))
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setText("Waiting for worker statistics...")
+        self.adjustSize()
+
+    def update_stats(self, stats):
+        lines = [
+            f"FPS {stats['fps']:5.1f}",
+            f"captured {stats['captured']}  processed {stats['processed']}  dropped {stats['dropped']}  "
+            f"coalesced {stats['coalesced']}",
+            f"{'stage':<11}{'mean':>7}{'p50':>7}{'p95':>7} ms",
+        ]
+        for stage in WORKER_STAGES:
+            summary = stats["stages"][stage]
+            lines.append(f"{stage:<11}{summary['mean_ms']:>7.1f}{summary['p50_ms']:>7.1f}{summary['p95_ms']:>7.1f}")
+        rates = stats.get("rates")
+        if rates is not None:
+            budget = "-" if rates["budget_ms"] is None else f"{rates['budget_ms']:.1f}"
+            lines.append(f"detect every {rates['detect_interval']} ({rates['detect_rate']:.1f}/s)  "
+                         f"classify every {rates['classify_interval']} ({rates['classify_rate']:.1f}/s)")
+            lines.append(f"budget {budget} ms/frame  predicted {rates['predicted_ms']:.1f} ms/frame")
+        self.setText("\n".join(lines))
+        self.adjustSize()
+
+
 class MainWindow(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = parent
         self.initUI()
 
-        # Initialize emotion detection worker
-        self.worker = EmotionDetectionWorker()
-        self.worker.result_signal.connect(self.process_worker_result)
-        self.worker.start()
-
-        # Initialize a deque to store the last 100 emotion detections
-        self.emotion_history = deque(maxlen=100)
-
-        # Initialize the camera as None
-        self.camera = None
-
-        # Create a timer for updating the video feed
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_video_feed)
-        # self.timer.start(33)  # Update roughly 30 times per second
-
-        # Initialize face cascade classifier
-        cascade_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ml",
-                                    "haarcascade_frontalface_default.xml")
-        self.face_cascade = cv2.CascadeClassifier(cascade_path)
-        if self.face_cascade.empty():
-            print(f"Error: Unable to load cascade classifier from {cascade_path}")
-
-    def detect_face(self, frame):
-        if frame is None:
-            return None, []
-
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        try:
-            # Adjusted parameters for more consistent detection
-            faces = self.face_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.1,
-                minNeighbors=5,
-                minSize=(120, 120),  # Increased minimum face size
-                maxSize=(400, 400)  # Added maximum face size
-            )
-        except cv2.error as e:
-            print(f"OpenCV error in face detection: {str(e)}")
-            return gray, []
-        except Exception as e:
-            print(f"Unexpected error in face detection: {str(e)}")
-            return gray, []
-
-        return gray, faces
-
-    def process_worker_result(self, frame, emotions, confidence):
-        # Update emotion history
-        for emotion_label, conf in emotions.items():
-            idx = self.worker.class_names.index(emotion_label)
-            self.emotion_history.append((idx, conf))
-
-        # Update the UI elements directly
-        self.update_video_label(frame)
-        self.update_emotional_feedback()
-        self.update_confidence_label(confidence)
-
-    def update_video_label(self, frame):
-        if frame is not None:
-            # Convert the frame to QImage for PyQt display
-            rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_image.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qt_image).scaled(288, 208, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.video_label.setPixmap(pixmap)
+        # Initialize emotion detection worker; it starts once the model is ready.
+        # It hands over its frames as images already fitted to the video widget or,
+        # with SOCIALSYNC_SHARED_FRAMES, as slots of its shared frame ring
+        if SHARED_FRAMES_ENABLED:
+            self.worker = EmotionDetectionWorker(shared_frames=True)
+            self.worker.frame_signal.connect(self.process_worker_frame)
+            self.show_worker_result = self.process_worker_frame
+        else:
+            video_bounds = self.video_widget.bounds
+            self.worker = EmotionDetectionWorker(display_size=(video_bounds.width(), video_bounds.height()))
+            self.worker.image_signal.connect(self.process_worker_image)
+            self.show_worker_result = self.process_worker_image
+        self.worker.result_ready.connect(self.take_worker_result)
+        self.worker.stats_signal.connect(self.developer_overlay.update_stats)
+        model_provider.ready.connect(self.on_model_ready)
+        model_provider.failed.connect(self.on_model_failed)
+        model_provider.state_changed.connect(self.on_model_state_changed)
+        self.start_worker()
+
+        # Emotion totals over the last few seconds, and the session's per-window summaries;
+        # start_session() sets the window length of each session
+        self.emotion_window = EmotionWindow(self.worker.class_names, EMOTION_WINDOW_SECONDS)
+
+        # Results only update the window above; the metrics are repainted from it at
+        # METRICS_REFRESH_FPS, independently of the video, and only if they changed
+        self.metrics_changed = False
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.timeout.connect(self.update_emotional_feedback)
+
+    def start_worker(self):
+        """Start the worker if the model is loaded, otherwise show that it is loading."""
+        if model_provider.is_ready():
+            self.worker.start()
+        else:
+            model_provider.start_loading()
+            self.on_model_state_changed(model_provider.state)
+
+    def on_model_state_changed(self, state):
+        if state == WARMING_UP:
+            self.confidence_label.setText("Preparing...")
+        elif state == LOADING:
+            self.confidence_label.setText("Loading emotion model...")
+
+    def on_model_ready(self):
+        self.confidence_label.setText("Confidence: 0%")
+        if self.isVisible():
+            self.worker.start()
+
+    def on_model_failed(self, message):
+        self.confidence_label.setText("Emotion model unavailable")
+
+    def take_worker_result(self):
+        """Handles the newest result in the worker's mailbox; older ones were coalesced into it."""
+        result = self.worker.take_result()
+        if result is not None:
+            self.show_worker_result(*result)
+
+    def process_worker_image(self, image, probabilities, confidence):
+        self.add_probabilities(probabilities)
+        self.video_widget.set_image(image)
+
+    def process_worker_frame(self, slot, sequence, probabilities, confidence):
+        ring = self.worker.frame_ring
+        if ring is not None:
+            self.video_widget.set_ring_frame(ring, slot, sequence)
+        self.add_probabilities(probabilities)
+
+    def add_probabilities(self, probabilities):
+        # Update emotion history; the metrics widgets follow on the next refresh
+        if len(probabilities):
+            self.emotion_window.add(probabilities, time.monotonic())
+            self.metrics_changed = True
 
     def update_confidence_label(self, confidence):
-        self.confidence_label.setText(f"Confidence: {int(confidence * 100)}%")
+        text = f"Confidence: {int(confidence * 100)}%"
+        if self.confidence_label.text() != text:
+            self.confidence_label.setText(text)
 
     def initUI(self):
         self.setWindowTitle('Emotion Recognition UI')
@@ -157,6 +264,21 @@ class MainWindow(QWidget):
         main_layout.addWidget(self.createMainContent())
         main_layout.addWidget(self.createBottomSection())
 
+        # Developer overlay with the worker's stage timings, toggled with Ctrl+Shift+D
+        self.developer_overlay = DeveloperOverlay(self)
+        self.developer_overlay.move(20, 90)
+        self.developer_overlay.setVisible(INSTRUMENTATION_ENABLED)
+        self.overlay_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        self.overlay_shortcut.activated.connect(self.toggle_developer_overlay)
+
+    def toggle_developer_overlay(self):
+        """Show or hide the developer overlay; the worker is only timed while it is shown."""
+        visible = self.developer_overlay.isHidden()
+        self.worker.instrumented = visible
+        self.developer_overlay.setVisible(visible)
+        if visible:
+            self.developer_overlay.raise_()
+
     def createHeader(self):
         header_container = QWidget(self)
         header_container.setStyleSheet("background-color: white;")
@@ -253,6 +375,7 @@ class MainWindow(QWidget):
               QProgressBar {{
                   background-color: rgba(255, 255, 255, 0.3);
                   border-radius: 5px;
+                  text-align: center;
               }}
               QProgressBar::chunk {{
                   background-color: {color.name()};
@@ -305,17 +428,15 @@ class MainWindow(QWidget):
         self.confidence_label.setText(f"Confidence: {int(confidence * 100)}%")
 
     def createVideoFeedSection(self):
-        section = RoundedFrame()
+        # The video is laid over the rounded frame instead of inside it: every repaint
+        # of a child would have the frame's drop shadow rendered and blurred again
+        section = QWidget()
         section.setFixedSize(320, 240)
 
-        layout = QVBoxLayout(section)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(0)
+        background = RoundedFrame(section)
+        background.setGeometry(0, 0, 320, 240)
 
-        self.video_label = QLabel(section)
-        self.video_label.setFixedSize(288, 208)
-        self.video_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(self.video_label)
+        self.video_widget = VideoWidget(QRect(16, 16, 288, 208), section)
 
         return section
 
@@ -404,146 +525,90 @@ Being annoyed is when you feel irritated or slightly angry because something is
 
         return section
 
-    def update_video_feed(self):
-        if self.camera is None or not self.camera.isOpened():
-            return
-
-        try:
-            ret, frame = self.camera.read()
-            if not ret:
-                print("Failed to capture frame")
-                return
-
-            # Maintain aspect ratio
-            frame = cv2.resize(frame, (640, 480))
-
-            gray, faces = self.detect_face(frame)
-            if gray is not None:
-                # Process each detected face
-                for (x, y, w, h) in faces:
-                    # Draw detection box with consistent thickness
-                    cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 0), 3)
-                    face_roi_gray = gray[y:y + h, x:x + w]
-                    face_roi_gray = preprocess(face_roi_gray)
-                    idx, conf = detect_emotion(face_roi_gray)
-
-                    emotion_label = self.worker.class_names[idx]
-
-                    # Adjusted label position and font size
-                    label_position = (x, y - 20) if y > 20 else (x, y + h + 30)
-                    cv2.putText(frame, emotion_label, label_position,
-                                cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
-
-                    self.emotion_history.append((idx, conf))
-
-            self.update_video_label(frame)
-            self.update_emotional_feedback()
-        except Exception as e:
-            print(f"Error in update_video_feed: {str(e)}")
-
     def update_emotional_feedback(self):
-        emotion_counts = np.zeros(len(self.worker.class_names))
-        total_conf = 0
-
-        # Sum the detected emotions and confidence levels from history
-        for idx, conf in self.emotion_history:
-            emotion_counts[idx] += conf
-            total_conf += conf
+        """
+        Repaints the emotion bars, percentages and confidence from the results
+        received since the last refresh. Widgets are only touched when their
+        displayed value changes.
+        """
+        # Results age out of the window even while no faces are seen
+        if self.emotion_window.advance(time.monotonic()):
+            self.metrics_changed = True
+        if not self.metrics_changed:
+            return
+        self.metrics_changed = False
 
-        # Calculate the percentages based on total confidence
-        if total_conf > 0:
-            emotion_percentages = (emotion_counts / total_conf) * 100
-        else:
-            emotion_percentages = np.zeros(len(self.worker.class_names))  # Set all to zero if no confidence
+        # Shares of the probability in the window, kept up to date as results arrive
+        emotion_percentages = self.emotion_window.percentages()
 
-        # Update the emotional feedback UI elements based on calculated percentages
         for i, (emotion, (color, label, progress_bar, percentage_label)) in enumerate(self.emotions_data.items()):
-            # Get the current percentage for this emotion
             percentage = int(emotion_percentages[i])
+            if progress_bar.value() != percentage:
+                progress_bar.setValue(percentage)
+                percentage_label.setText(f"{percentage}%")
 
-            # Set the progress bar and percentage label to reflect the percentage
-            progress_bar.setValue(percentage)
-            percentage_label.setText(f"{percentage}%")
-
-            # Update progress bar style
-            progress_bar.setStyleSheet(f"""
-              QProgressBar {{
-                  background-color: rgba(255, 255, 255, 0.3);
-                  border-radius: 5px;
-                  text-align: center;
-              }}
-              QProgressBar::chunk {{
-                  background-color: {color.name()};
-                  border-radius: 5px;
-              }}
-          """)
-
-        # Update confidence with the average confidence across recent frames
-        avg_confidence = total_conf / len(self.emotion_history) if self.emotion_history else 0
-        self.confidence_label.setText(f"Confidence: {int(avg_confidence * 100)}%")
+        self.update_confidence_label(self.emotion_window.confidence())
 
     def closeEvent(self, event):
         """Ensure video resources are released when closing the window."""
         try:
             self.worker.stop()
             self.worker.wait()
-            self.stop_camera()
+            self.video_widget.clear()
+            self.worker.close()
+            self.stop_metrics_refresh()
         except Exception as e:
             print(f"Error in closeEvent: {str(e)}")
         finally:
             event.accept()
 
+    def start_session(self, window_seconds=None):
+        """
+        Starts a new session whose emotion percentages cover the last window_seconds
+        seconds (EMOTION_WINDOW_SECONDS if None); its summaries use the same length.
+        """
+        if window_seconds is None:
+            window_seconds = EMOTION_WINDOW_SECONDS
+        if window_seconds != self.emotion_window.window:
+            self.emotion_window = EmotionWindow(self.worker.class_names, window_seconds)
+        else:
+            self.emotion_window.reset()
+        self.metrics_changed = True
+
     def endSession(self):
         """Handle the End Session button click"""
         self.worker.stop()
         self.worker.wait()
-        self.stop_camera()
+        self.stop_metrics_refresh()
+        # Hand the session's per-window summaries to its overview page and start the next session afresh
+        summaries = self.emotion_window.summaries()
+        self.emotion_window.reset()
+        self.metrics_changed = True
         if self.main_window:
+            self.main_window.user_session_overview.show_session(summaries)
             self.main_window.show_home_page()
         else:
             print("Warning: main_window is None, cannot show user session overview")
             self.close()
 
     def showEvent(self, event):
-        """Start the camera when the window is shown"""
+        """Start the worker, which subscribes to the shared camera, when the window is shown"""
         super().showEvent(event)
-        self.start_camera()
-        self.worker.start()
+        self.start_metrics_refresh()
+        self.start_worker()
 
     def hideEvent(self, event):
-        """Release camera resources when the window is hidden"""
+        """Stop the worker when the window is hidden; the shared camera pauses but stays open"""
         super().hideEvent(event)
-        self.stop_camera()
+        self.stop_metrics_refresh()
         self.worker.stop()
         self.worker.wait()
 
-    def stop_camera(self):
-        self.timer.stop()
-        if self.camera is not None and self.camera.isOpened():
-            self.camera.release()
-            self.camera = None
-
-    def start_camera(self):
-        if self.camera is None or not self.camera.isOpened():
-            try:
-                self.camera = cv2.VideoCapture(0)
-                if not self.camera.isOpened():
-                    print("Error: Unable to open camera")
-                    return
-
-                # Set camera resolution to 1280x720
-                self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-                self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-
-                # Warm up the camera
-                for _ in range(30):  # Skip first 30 frames
-                    ret, _ = self.camera.read()
-                    if not ret:
-                        break
-
-                self.timer.start(33)
-            except Exception as e:
-                print(f"Error initializing camera: {str(e)}")
+    def stop_metrics_refresh(self):
+        self.metrics_timer.stop()
+
+    def start_metrics_refresh(self):
+        self.metrics_timer.start(int(1000 / METRICS_REFRESH_FPS))
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -0,0 +1,51 @@
+"""
+Compares per-face and batched emotion inference.
+Reports the per-frame latency against the number of faces in view.
+
+Run from the project root:
+    python -m ui.scripts.benchmark_batched_inference
+"""
+import time
+import numpy as np
+from ui.controllers.emotion_recognition import detect_emotion, detect_emotions, preprocess
+
+MAX_FACES = 5
+REPEATS = 50
+
+
+def make_faces(count, seed=0):
+    """Creates random gray face crops of varying size, like Haar ROIs."""
+    rng = np.random.default_rng(seed)
+    faces = []
+    for _ in range(count):
+        size = int(rng.integers(60, 160))
+        faces.append(rng.integers(0, 256, (size, size), dtype=np.uint8))
+    return faces
+
+
+def time_frames(classify, faces_p):
+    """Returns the median milliseconds taken to classify one frame worth of faces."""
+    classify(faces_p)  # Warm up
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        classify(faces_p)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def per_face(faces_p):
+    return [detect_emotion(face) for face in faces_p]
+
+
+def main():
+    print(f"{'faces':>5} | {'per-face ms':>11} | {'batched ms':>10} | {'speedup':>7}")
+    for count in range(1, MAX_FACES + 1):
+        faces_p = [preprocess(face) for face in make_faces(count)]
+        per_face_ms = time_frames(per_face, faces_p)
+        batched_ms = time_frames(detect_emotions, faces_p)
+        print(f"{count:>5} | {per_face_ms:>11.2f} | {batched_ms:>10.2f} | {per_face_ms / batched_ms:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
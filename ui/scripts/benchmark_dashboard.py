@@ -0,0 +1,123 @@
+"""
+Measures how busy the session dashboard keeps the UI thread: it shows the
+dashboard on the synthetic source (or a clip) for the given seconds and times
+every event Qt dispatches, which includes the worker's queued results, the
+timers and the repaints they cause.
+
+Reported: UI-thread milliseconds per second (of wall time), split into worker
+results, timers, painting and other events, worker signals received per second
+and UI-thread milliseconds per frame (the busy time over the signals received).
+With --stall-ms the UI thread is also blocked that long once a second, as by a
+modal dialog or a page change, and the results the worker's mailbox coalesced
+meanwhile are reported (run with SOCIALSYNC_RESULT_MAILBOX=0 to compare with
+queued delivery). With --per-result the metrics are repainted after every result
+instead of on the refresh timer, which measures what the coalescing saves.
+
+Run from the project root (QT_QPA_PLATFORM=offscreen works without a display):
+    python -m ui.scripts.benchmark_dashboard [--clip PATH] [--seconds 10] [--stall-ms 0] [--per-result]
+"""
+import os
+import sys
+import time
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Session dashboard UI-thread load")
+    parser.add_argument("--clip", help="video file or image directory; synthetic frames if omitted")
+    parser.add_argument("--seconds", type=float, default=10.0, help="measured seconds")
+    parser.add_argument("--stall-ms", type=int, default=0, help="block the UI thread this long every second")
+    parser.add_argument("--per-result", action="store_true", help="repaint the metrics after every result")
+    args = parser.parse_args()
+
+    # The frame source is chosen from the environment when emotion_recognition is imported
+    if args.clip is None:
+        os.environ["SOCIALSYNC_FRAME_SOURCE"] = "synthetic"
+    else:
+        os.environ["SOCIALSYNC_FRAME_SOURCE"] = "images" if os.path.isdir(args.clip) else "video"
+        os.environ["SOCIALSYNC_FRAME_SOURCE_PATH"] = os.path.abspath(args.clip)
+        os.environ["SOCIALSYNC_FRAME_SOURCE_LOOP"] = "1"
+
+    from PyQt5.QtCore import QTimer, QEvent
+    from PyQt5.QtWidgets import QApplication
+    from ui.controllers.emotion_recognition import model_provider, camera_service
+    from ui.pyqt.u7_camera_working_session_dashboard import MainWindow
+
+    class TimedApplication(QApplication):
+        """Adds up the time spent dispatching events, i.e. the UI thread's busy time."""
+        def __init__(self, argv):
+            super().__init__(argv)
+            self.measuring = False
+            self.busy = {"results": 0.0, "timers": 0.0, "painting": 0.0, "other": 0.0}
+            self.results = 0
+            self.depth = 0
+
+        def notify(self, receiver, event):
+            if not self.measuring or self.depth:
+                return super().notify(receiver, event)
+            self.depth += 1
+            start = time.perf_counter()
+            try:
+                return super().notify(receiver, event)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.depth -= 1
+                kind = event.type()
+                # Signals queued by the worker thread arrive as MetaCall events
+                if kind == QEvent.MetaCall:
+                    self.busy["results"] += elapsed
+                    self.results += 1
+                elif kind == QEvent.Timer:
+                    self.busy["timers"] += elapsed
+                elif kind in (QEvent.Paint, QEvent.UpdateRequest):
+                    self.busy["painting"] += elapsed
+                else:
+                    self.busy["other"] += elapsed
+
+    app = TimedApplication(sys.argv)
+    if not model_provider.wait():
+        raise RuntimeError(f"Models are unavailable: {model_provider.error}")
+    window = MainWindow(None)
+    window.show()
+    if args.per_result:
+        # Connected after the dashboard's own slots, so each result is added first
+        window.stop_metrics_refresh()
+        for signal in (window.worker.image_signal, window.worker.frame_signal, window.worker.result_ready):
+            signal.connect(window.update_emotional_feedback)
+
+    def stall():
+        time.sleep(args.stall_ms / 1000)
+
+    stall_timer = QTimer()
+    stall_timer.timeout.connect(stall)
+
+    def start():
+        app.measuring = True
+        app.started = time.perf_counter()
+        app.coalesced = window.worker.coalesced_results
+        if args.stall_ms:
+            stall_timer.start(1000)
+        QTimer.singleShot(int(args.seconds * 1000), finish)
+
+    def finish():
+        app.measuring = False
+        stall_timer.stop()
+        wall = time.perf_counter() - app.started
+        print(f"UI thread busy: {1000 * sum(app.busy.values()) / wall:.1f} ms/s")
+        for kind, busy in app.busy.items():
+            print(f"{kind:>10}: {1000 * busy / wall:7.1f} ms/s")
+        print(f"{app.results / wall:.1f} worker signals/s, "
+              f"{1000 * sum(app.busy.values()) / max(app.results, 1):.2f} UI-thread ms per frame")
+        print(f"{window.worker.coalesced_results - app.coalesced} results coalesced, "
+              f"{window.worker.frames_processed} processed in total")
+        window.close()
+        camera_service.close()
+        app.quit()
+
+    # Let the camera and the worker settle before measuring
+    QTimer.singleShot(2000, start)
+    app.exec_()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmarks Haar detection time on the emotion pipeline's 320x240 frames at several
+detection scales, and how many full-resolution detections each scale still finds.
+
+Run from the project root with a recorded clip or a directory of frames:
+    python -m ui.scripts.benchmark_detection_scale <video file | image dir>
+Without an argument, synthetic noise frames are used (timings only).
+"""
+import os
+import sys
+import time
+import cv2
+import numpy as np
+from ui.controllers.emotion_recognition import PIPELINE_DETECTOR_PARAMS
+from ui.controllers.face_detection import detect_downscaled, detection_scale_for
+from ui.controllers.face_tracking import box_iou
+from ui.utils.dataset_utils import read_clip
+
+CASCADE_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "ml", "haarcascade_frontalface_default.xml"
+))
+FRAME_SIZE = (320, 240)
+MIN_FACE_SIZE = PIPELINE_DETECTOR_PARAMS["min_size"]
+MAX_FACE_SIZE = PIPELINE_DETECTOR_PARAMS["max_size"]
+MAX_FRAMES = 200
+SCALES = [1.0, 0.75, detection_scale_for(MIN_FACE_SIZE), 0.5]
+
+
+def load_frames(source):
+    """Reads up to MAX_FRAMES gray frames from a video file or an image directory."""
+    if source is None:
+        rng = np.random.default_rng(0)
+        return [rng.integers(0, 256, FRAME_SIZE[::-1], dtype=np.uint8) for _ in range(20)]
+    frames = read_clip(source, MAX_FRAMES)
+    return [cv2.cvtColor(cv2.resize(frame, FRAME_SIZE), cv2.COLOR_BGR2GRAY) for frame in frames]
+
+
+def detect_all(cascade, frames, scale):
+    timings, detections = [], []
+    for gray in frames:
+        start = time.perf_counter()
+        faces = detect_downscaled(cascade, gray, scale, min_size=MIN_FACE_SIZE, max_size=MAX_FACE_SIZE)
+        timings.append((time.perf_counter() - start) * 1000)
+        detections.append(faces)
+    return timings, detections
+
+
+def recall(reference, detections):
+    """Share of full-resolution boxes matched by a box at IoU >= 0.5."""
+    total = matched = 0
+    for ref_faces, faces in zip(reference, detections):
+        for ref in ref_faces:
+            total += 1
+            matched += any(box_iou(ref, face) >= 0.5 for face in faces)
+    return matched / total if total else float("nan")
+
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else None
+    cascade = cv2.CascadeClassifier(CASCADE_PATH)
+    frames = load_frames(source)
+    print(f"{len(frames)} frames from {source or 'synthetic noise'}")
+
+    _, reference = detect_all(cascade, frames, 1.0)
+    print(f"{'scale':>6} | {'p50 ms':>7} | {'p95 ms':>7} | {'faces/frame':>11} | {'recall vs 1.0':>13}")
+    for scale in SCALES:
+        timings, detections = detect_all(cascade, frames, scale)
+        faces_per_frame = np.mean([len(faces) for faces in detections])
+        print(f"{scale:>6.3f} | {np.median(timings):>7.2f} | {np.percentile(timings, 95):>7.2f} | "
+              f"{faces_per_frame:>11.2f} | {recall(reference, detections):>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
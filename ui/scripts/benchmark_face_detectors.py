@@ -0,0 +1,88 @@
+"""
+Shared benchmark for the face detectors in ui/controllers/face_detection.py.
+Reports detector throughput (frames/s and faces/s), recall and precision on a labeled clip.
+
+The clip is a video file or an image directory, resized to the emotion pipeline's 320x240.
+The labels file is JSON mapping frame index to the faces in that frame, in clip
+pixel coordinates: {"0": [[x, y, w, h], ...], "1": [], ...}.
+Frames missing from the labels file are skipped when scoring.
+
+Run from the project root:
+    python -m ui.scripts.benchmark_face_detectors <clip> <labels.json>
+"""
+import sys
+import json
+import time
+import cv2
+from ui.controllers.emotion_recognition import cascade_path, PIPELINE_DETECTOR_PARAMS
+from ui.controllers.face_detection import create_detector
+from ui.controllers.face_tracking import box_iou
+from ui.utils.dataset_utils import read_clip
+from ui.utils.runtime_config import DETECT_INTERVAL, TRACK_MIN_CONFIDENCE, BUNDLED_CASCADE
+
+FRAME_SIZE = (320, 240)
+MATCH_IOU = 0.5
+# The emotion pipeline's cascade parameters, with automatic detection downscale
+PIPELINE_PARAMS = dict(PIPELINE_DETECTOR_PARAMS, detection_scale="auto")
+
+CANDIDATES = [
+    ("haar (pipeline)", "haar", PIPELINE_PARAMS),
+    ("haar (full res)", "haar", dict(PIPELINE_PARAMS, detection_scale=1.0)),
+    ("bundled alt2", "bundled", PIPELINE_PARAMS),
+    ("tracking + haar", "tracking", PIPELINE_PARAMS),
+]
+
+
+def load_labeled_clip(clip_path, labels_path):
+    """Returns gray 320x240 frames and {frame index: [scaled boxes]}."""
+    frames = read_clip(clip_path)
+    with open(labels_path) as file:
+        labels = {int(index): boxes for index, boxes in json.load(file).items()}
+
+    scaled_labels = {}
+    grays = []
+    for index, frame in enumerate(frames):
+        fx, fy = FRAME_SIZE[0] / frame.shape[1], FRAME_SIZE[1] / frame.shape[0]
+        grays.append(cv2.cvtColor(cv2.resize(frame, FRAME_SIZE), cv2.COLOR_BGR2GRAY))
+        if index in labels:
+            scaled_labels[index] = [(x * fx, y * fy, w * fx, h * fy) for x, y, w, h in labels[index]]
+    return grays, scaled_labels
+
+
+def score(detections, labels):
+    """Returns (recall, precision) of the detections against the labeled boxes."""
+    true_positives = labeled = detected = 0
+    for index, boxes in labels.items():
+        faces = detections[index]
+        labeled += len(boxes)
+        detected += len(faces)
+        true_positives += sum(any(box_iou(box, face) >= MATCH_IOU for face in faces) for box in boxes)
+    recall = true_positives / labeled if labeled else float("nan")
+    precision = true_positives / detected if detected else float("nan")
+    return recall, precision
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    frames, labels = load_labeled_clip(sys.argv[1], sys.argv[2])
+    print(f"{len(frames)} frames, {sum(len(b) for b in labels.values())} labeled faces in {len(labels)} frames")
+
+    print(f"{'detector':>17} | {'frames/s':>8} | {'faces/s':>8} | {'recall':>6} | {'precision':>9}")
+    for label, name, params in CANDIDATES:
+        detector = create_detector(name, cascade_path, BUNDLED_CASCADE, "haar",
+                                   DETECT_INTERVAL, TRACK_MIN_CONFIDENCE, **params)
+        detections = []
+        start = time.perf_counter()
+        for gray in frames:
+            detections.append(detector.detect(gray))
+        elapsed = time.perf_counter() - start
+        found = sum(len(faces) for faces in detections)
+        recall, precision = score(detections, labels)
+        print(f"{label:>17} | {len(frames) / elapsed:>8.1f} | {found / elapsed:>8.1f} | "
+              f"{recall:>6.3f} | {precision:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
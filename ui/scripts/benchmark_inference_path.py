@@ -0,0 +1,49 @@
+"""
+Micro-benchmark of the compiled inference callable against model.predict.
+
+Run from the project root:
+    python -m ui.scripts.benchmark_inference_path
+"""
+import time
+import numpy as np
+from ui.controllers.inference_backends import KerasBackend
+from ui.scripts.export_tflite import KERAS_MODEL_PATH
+
+BATCH_SIZES = (1, 2, 4)
+REPEATS = 200
+
+
+def time_calls(call, batch):
+    """Returns the median and p95 milliseconds of one call."""
+    call(batch)  # Warm up
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        call(batch)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings)), float(np.percentile(timings, 95))
+
+
+def main():
+    backend = KerasBackend(KERAS_MODEL_PATH)
+
+    def keras_predict(batch):
+        return backend.model.predict(batch, verbose=0)
+
+    def compiled(batch):
+        return backend.predict(batch)
+
+    rng = np.random.default_rng(0)
+    print(f"{'batch':>5} | {'predict p50/p95 ms':>18} | {'compiled p50/p95 ms':>19} | {'speedup':>7}")
+    for size in BATCH_SIZES:
+        batch = rng.random((size, 48, 48, 3), dtype=np.float32)
+        if not np.allclose(keras_predict(batch), compiled(batch), atol=1e-5):
+            print(f"Warning: outputs differ for batch size {size}")
+        predict_p50, predict_p95 = time_calls(keras_predict, batch)
+        compiled_p50, compiled_p95 = time_calls(compiled, batch)
+        print(f"{size:>5} | {predict_p50:>8.2f} / {predict_p95:>7.2f} | {compiled_p50:>8.2f} / {compiled_p95:>8.2f} | "
+              f"{predict_p50 / compiled_p50:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Scaling benchmark of the shared inference service and the cross-stream batch
+scheduler against in-process inference.
+For 1 to N concurrent sessions, each a thread running the emotion pipeline on
+its own synthetic source with two faces per frame, it reports the combined FPS,
+the FPS per session and the p50/p95 latency of the predict stage.
+
+Every mode runs in a fresh process: "in-process" shares one model between the
+session threads, "scheduler" batches the faces of all sessions together on that
+model, "pool:P" sends the batches to an inference service of P processes and
+"sched+pool:P" batches them across sessions before sending them to the pool.
+
+Run from the project root:
+    python -m ui.scripts.benchmark_inference_service [--sessions N] [--pools 1 2] [--seconds 5]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import subprocess
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+FACES_PER_FRAME = 2
+
+
+def run_session(pipeline, source, seconds, result):
+    """Processes frames for the given seconds and stores the frame count and predict times."""
+    from ui.utils.perf_utils import StageTimer
+    timer = StageTimer()
+    predict_times = []
+    frames = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        _, frame = source.read()
+        timer.start()
+        pipeline.process(frame, timer)
+        if "predict" in timer.stages:
+            predict_times.append(timer.stages["predict"])
+        frames += 1
+    result["frames"] = frames
+    result["predict_times"] = predict_times
+
+
+def run_sessions(max_sessions, seconds):
+    """
+    Runs 1 to max_sessions concurrent sessions in this process.
+    Returns one result dict per session count.
+    """
+    from ui.controllers.emotion_recognition import EmotionPipeline, model_provider
+    from ui.controllers.frame_sources import SyntheticSource, FAST
+    from ui.utils.perf_utils import latency_summary
+
+    if not model_provider.wait():
+        raise RuntimeError(f"Models are unavailable: {model_provider.error}")
+    results = []
+    for sessions in range(1, max_sessions + 1):
+        session_results = [{} for _ in range(sessions)]
+        threads = []
+        for index, result in enumerate(session_results):
+            pipeline = EmotionPipeline(['Annoyed', 'Happiness', 'Sad', 'Upset'])
+            source = SyntheticSource(faces=FACES_PER_FRAME, seed=index, pacing=FAST)
+            threads.append(threading.Thread(target=run_session, args=(pipeline, source, seconds, result)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        frames = [result["frames"] for result in session_results]
+        predict_times = [t for result in session_results for t in result["predict_times"]]
+        results.append({
+            "sessions": sessions,
+            "total_fps": sum(frames) / seconds,
+            "session_fps": [count / seconds for count in frames],
+            "predict": latency_summary(predict_times),
+        })
+    return results
+
+
+def run_mode(settings, max_sessions, seconds):
+    """Runs every session count in a fresh interpreter with the given runtime_config settings."""
+    env = dict(os.environ, **settings)
+    command = [sys.executable, "-m", "ui.scripts.benchmark_inference_service", "--child",
+               "--sessions", str(max_sessions), "--seconds", str(seconds)]
+    result = subprocess.run(command, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        if line.startswith("RESULT"):
+            return json.loads(line.split(" ", 1)[1])
+    raise RuntimeError(f"Benchmark process failed:\n{result.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inference service scaling benchmark")
+    parser.add_argument("--sessions", type=int, default=4, help="largest number of concurrent sessions")
+    parser.add_argument("--pools", type=int, nargs="*", default=[1, 2], help="inference service sizes to test")
+    parser.add_argument("--seconds", type=float, default=5.0, help="measured seconds per session count")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print("RESULT", json.dumps(run_sessions(args.sessions, args.seconds)), flush=True)
+        return
+
+    print(f"{os.cpu_count()} CPUs, {FACES_PER_FRAME} faces per frame")
+    print(f"{'mode':>12} | {'sessions':>8} | {'total fps':>9} | {'fps/session':>11} | "
+          f"{'predict p50':>11} | {'predict p95':>11}")
+    results = {}
+    modes = [("in-process", {}), ("scheduler", {"SOCIALSYNC_BATCH_SCHEDULER": "1"})]
+    for processes in args.pools:
+        modes.append((f"pool:{processes}", {"SOCIALSYNC_INFERENCE_PROCESSES": str(processes)}))
+        modes.append((f"sched+pool:{processes}", {"SOCIALSYNC_INFERENCE_PROCESSES": str(processes),
+                                                  "SOCIALSYNC_BATCH_SCHEDULER": "1"}))
+    for mode, settings in modes:
+        results[mode] = run_mode(settings, args.sessions, args.seconds)
+        for row in results[mode]:
+            per_session = row["total_fps"] / row["sessions"]
+            print(f"{mode:>12} | {row['sessions']:>8} | {row['total_fps']:>9.1f} | {per_session:>11.1f} | "
+                  f"{row['predict']['p50_ms']:>11.2f} | {row['predict']['p95_ms']:>11.2f}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Headless end-to-end benchmark of the emotion pipeline: read, resize, detect,
+preprocess, predict, aggregate and annotate, as EmotionDetectionWorker runs them,
+but without Qt and with frames read as fast as the pipeline takes them.
+
+Each face count runs in a fresh process so peak RSS is per configuration.
+To get n faces per frame, every clip frame is resized to the worker's 320x240 and
+tiled n times (1x1, 2x1, 2x2), so each tile holds the clip's faces at the size
+the worker sees them; the read stage includes decoding and tiling.
+Without a clip the synthetic source is used.
+
+Reported per face count: sustained FPS, per-stage mean/p50/p95/p99 latency,
+faces detected per frame, peak RSS and CPU utilisation (CPU time over wall time,
+100% being one core). Results are written as JSON for comparison across runs.
+
+Run from the project root:
+    python -m ui.scripts.benchmark_pipeline [--clip PATH] [--faces 1 2 4] [--frames 300] [--output FILE]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import cv2
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+TILE_SIZE = (320, 240)
+STAGES = ["read", "resize", "detect", "preprocess", "predict", "aggregate", "annotate"]
+WARMUP_FRAMES = 10
+
+
+def grid_for(faces):
+    """Returns the (columns, rows) tile grid for a face count: 1x1, 2x1, 2x2, 3x2, ..."""
+    columns = int(np.ceil(np.sqrt(faces)))
+    return columns, int(np.ceil(faces / columns))
+
+
+def open_clip(clip):
+    """Opens the clip, or the synthetic source, as a looping source read without pacing."""
+    from ui.controllers.frame_sources import open_frame_source, FAST
+    if clip is None:
+        return open_frame_source("synthetic", width=TILE_SIZE[0], height=TILE_SIZE[1], pacing=FAST)
+    kind = "images" if os.path.isdir(clip) else "video"
+    return open_frame_source(kind, clip, pacing=FAST, loop=True)
+
+
+def run_configuration(clip, faces, frames):
+    """
+    Runs the pipeline over frames tiled for the face count in this process.
+    Returns the measurements as a dict.
+    """
+    from ui.controllers.emotion_recognition import EmotionPipeline, model_provider
+    from ui.utils.perf_utils import StageTimer, latency_summary, peak_rss_mb, cpu_seconds
+    from ui.utils.thread_budget import apply_opencv_threads
+
+    apply_opencv_threads()
+    if not model_provider.wait():
+        raise RuntimeError(f"Models are unavailable: {model_provider.error}")
+    columns, rows = grid_for(faces)
+    source = open_clip(clip)
+    pipeline = EmotionPipeline(['Annoyed', 'Happiness', 'Sad', 'Upset'], frame_size=None)
+
+    def read_tiled():
+        ret, frame = source.read()
+        if not ret:
+            raise RuntimeError("The clip returned no frames")
+        if frame.shape[1::-1] != TILE_SIZE:
+            frame = cv2.resize(frame, TILE_SIZE)
+        return np.tile(frame, (rows, columns, 1))
+
+    for _ in range(WARMUP_FRAMES):
+        pipeline.process(read_tiled())
+
+    timer = StageTimer()
+    samples = {stage: [] for stage in STAGES}
+    frame_times = []
+    detected = 0
+    cpu_start = cpu_seconds()
+    wall_start = time.perf_counter()
+    for _ in range(frames):
+        timer.start()
+        frame = read_tiled()
+        timer.mark("read")
+        pipeline.process(frame, timer)
+        # Stages after detect are skipped on frames without faces and count as 0
+        for stage in STAGES:
+            samples[stage].append(timer.stages.get(stage, 0.0))
+        frame_times.append(sum(timer.stages.values()))
+        detected += len(pipeline.tracks)
+    wall = time.perf_counter() - wall_start
+    cpu = cpu_seconds() - cpu_start
+    source.release()
+
+    return {
+        "faces_per_frame": faces,
+        "frame_size": [TILE_SIZE[0] * columns, TILE_SIZE[1] * rows],
+        "frames": frames,
+        "wall_s": wall,
+        "sustained_fps": frames / wall,
+        "frame_latency": latency_summary(frame_times),
+        "stages": {stage: latency_summary(values) for stage, values in samples.items()},
+        "detected_faces_per_frame": detected / frames,
+        "peak_rss_mb": peak_rss_mb(),
+        "cpu_utilisation_pct": 100 * cpu / wall,
+    }
+
+
+def run_in_fresh_process(clip, faces, frames, settings=None):
+    """
+    Runs one configuration in a new interpreter and returns its result dict.
+    settings are extra SOCIALSYNC_ environment variables for that interpreter.
+    """
+    command = [sys.executable, "-m", "ui.scripts.benchmark_pipeline", "--child",
+               "--faces", str(faces), "--frames", str(frames)]
+    if clip is not None:
+        command += ["--clip", os.path.abspath(clip)]
+    env = dict(os.environ, **(settings or {}))
+    result = subprocess.run(command, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        if line.startswith("RESULT"):
+            return json.loads(line.split(" ", 1)[1])
+    raise RuntimeError(f"Benchmark process failed:\n{result.stderr}")
+
+
+def run_metadata(clip):
+    """Describes the machine, revision and settings a run was made with."""
+    from ui.utils import runtime_config
+    from ui.utils.thread_budget import thread_plan
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                  capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        revision = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": revision,
+        "clip": clip or "synthetic",
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "inference_backend": runtime_config.INFERENCE_BACKEND,
+        "face_detector": runtime_config.FACE_DETECTOR,
+        "max_batch_size": runtime_config.MAX_BATCH_SIZE,
+        "threads": thread_plan(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless end-to-end emotion pipeline benchmark")
+    parser.add_argument("--clip", help="video file or image directory; synthetic frames if omitted")
+    parser.add_argument("--faces", type=int, nargs="+", default=[1, 2, 4], help="faces per frame to test")
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per face count")
+    parser.add_argument("--output", help="JSON results file (default: pipeline_benchmark_<time>.json)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = run_configuration(args.clip, args.faces[0], args.frames)
+        print("RESULT", json.dumps(result), flush=True)
+        return
+
+    results = {"run": run_metadata(args.clip), "configurations": []}
+    print(f"{'faces':>5} | {'fps':>6} | {'frame p50':>9} | {'p95':>6} | {'p99':>6} | "
+          f"{'detected':>8} | {'rss MiB':>7} | {'cpu %':>5}")
+    for faces in args.faces:
+        result = run_in_fresh_process(args.clip, faces, args.frames)
+        results["configurations"].append(result)
+        latency = result["frame_latency"]
+        rss = result["peak_rss_mb"]
+        print(f"{faces:>5} | {result['sustained_fps']:>6.1f} | {latency['p50_ms']:>9.2f} | "
+              f"{latency['p95_ms']:>6.2f} | {latency['p99_ms']:>6.2f} | "
+              f"{result['detected_faces_per_frame']:>8.2f} | "
+              f"{rss if rss is None else format(rss, '.0f'):>7} | {result['cpu_utilisation_pct']:>5.0f}")
+
+    print()
+    print(f"{'stage p50/p95/p99 ms':>20} | " + " | ".join(f"{faces:>2} faces{'':>12}" for faces in args.faces))
+    for stage in STAGES:
+        cells = []
+        for result in results["configurations"]:
+            summary = result["stages"][stage]
+            cells.append(f"{summary['p50_ms']:>6.2f}/{summary['p95_ms']:>6.2f}/{summary['p99_ms']:>6.2f}")
+        print(f"{stage:>20} | " + " | ".join(cells))
+
+    output = args.output or f"pipeline_benchmark_{time.strftime('%Y%m%d-%H%M%S')}.json"
+    with open(output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measures time-to-login-screen: from process launch until the main window has painted.
+Compares lazy background model loading (what main.py does) with loading the
+model before the window is created (the previous behaviour).
+
+Run from the project root:
+    python -m ui.scripts.benchmark_startup [runs]
+"""
+import os
+import sys
+import time
+import subprocess
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+CHILD = """
+import sys, time
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+from ui.controllers.emotion_recognition import model_provider
+if {eager}:
+    model_provider.wait()
+from ui.pyqt.main_window import MainWindow
+
+app = QApplication(sys.argv)
+window = MainWindow()
+window.show()
+
+def painted():
+    print("PAINTED", time.time(), flush=True)
+    app.quit()
+
+QTimer.singleShot(0, painted)
+QTimer.singleShot(0, model_provider.start_loading)
+app.exec_()
+"""
+
+
+def time_to_login_screen(eager):
+    """Returns the seconds from launching a fresh interpreter until the window paints."""
+    start = time.time()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(eager=eager)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("PAINTED"):
+            return float(line.split()[1]) - start
+    raise RuntimeError(f"Window never painted:\n{result.stderr}")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    for label, eager in (("eager (before)", True), ("lazy (after)", False)):
+        timings = [time_to_login_screen(eager) for _ in range(runs)]
+        print(f"{label:>15}: median {np.median(timings):.2f}s, min {min(timings):.2f}s over {runs} runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Sweeps thread splits between OpenCV's pool and TensorFlow's intra-op and
+inter-op pools, and finds the one with the best sustained FPS on this machine.
+Every split runs the headless pipeline benchmark in a fresh process (TensorFlow's
+pools can only be sized before its first op) at the given faces per frame.
+Counts default to 1, 2, 4, ... up to the CPU count.
+
+Run from the project root:
+    python -m ui.scripts.benchmark_thread_budget [--faces 2] [--frames 200]
+        [--opencv 1 2 4] [--intra 1 2 4] [--inter 1 2] [--output FILE]
+
+The best split is printed as the environment variables to set.
+"""
+import os
+import json
+import argparse
+import itertools
+from ui.scripts.benchmark_pipeline import run_in_fresh_process
+from ui.utils.thread_budget import split_thread_budget
+
+
+def default_counts():
+    """Returns 1, 2, 4, ... up to and including the CPU count."""
+    cpus = os.cpu_count() or 1
+    counts = {cpus}
+    count = 1
+    while count < cpus:
+        counts.add(count)
+        count *= 2
+    return sorted(counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenCV / TensorFlow thread split sweep")
+    parser.add_argument("--faces", type=int, default=2, help="faces per frame")
+    parser.add_argument("--frames", type=int, default=200, help="measured frames per split")
+    parser.add_argument("--clip", help="video file or image directory; synthetic frames if omitted")
+    parser.add_argument("--opencv", type=int, nargs="+", default=default_counts(), help="OpenCV thread counts")
+    parser.add_argument("--intra", type=int, nargs="+", default=default_counts(), help="TensorFlow intra-op counts")
+    parser.add_argument("--inter", type=int, nargs="+", default=[1, 2], help="TensorFlow inter-op counts")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.faces} faces per frame; "
+          f"default split of the full budget: {split_thread_budget(os.cpu_count() or 1)}")
+    print(f"{'opencv':>6} | {'intra':>5} | {'inter':>5} | {'fps':>6} | {'frame p95 ms':>12} | {'cpu %':>5}")
+    results = []
+    for opencv, intra, inter in itertools.product(args.opencv, args.intra, args.inter):
+        settings = {
+            "SOCIALSYNC_OPENCV_THREADS": str(opencv),
+            "SOCIALSYNC_TF_INTRA_OP_THREADS": str(intra),
+            "SOCIALSYNC_TF_INTER_OP_THREADS": str(inter),
+        }
+        result = run_in_fresh_process(args.clip, args.faces, args.frames, settings)
+        results.append({"opencv": opencv, "tf_intra_op": intra, "tf_inter_op": inter,
+                        "sustained_fps": result["sustained_fps"],
+                        "frame_p95_ms": result["frame_latency"]["p95_ms"],
+                        "cpu_utilisation_pct": result["cpu_utilisation_pct"]})
+        print(f"{opencv:>6} | {intra:>5} | {inter:>5} | {result['sustained_fps']:>6.1f} | "
+              f"{result['frame_latency']['p95_ms']:>12.2f} | {result['cpu_utilisation_pct']:>5.0f}")
+
+    best = max(results, key=lambda row: row["sustained_fps"])
+    print("\nBest split:")
+    print(f"    SOCIALSYNC_OPENCV_THREADS={best['opencv']} "
+          f"SOCIALSYNC_TF_INTRA_OP_THREADS={best['tf_intra_op']} "
+          f"SOCIALSYNC_TF_INTER_OP_THREADS={best['tf_inter_op']}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"cpu_count": os.cpu_count(), "faces": args.faces, "results": results, "best": best},
+                      file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
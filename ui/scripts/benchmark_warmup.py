@@ -0,0 +1,64 @@
+"""
+Measures first-frame and first-10-frame latency of the emotion pipeline in a fresh
+process, with and without the warm-up phase (the model's, then the pipeline's own
+detector, as EmotionDetectionWorker does). Frames come from synthetic sources
+whose face counts cycle from 1 to 3, so several batch sizes are hit early, as in
+a session.
+
+Run from the project root:
+    python -m ui.scripts.benchmark_warmup [runs]
+"""
+import os
+import sys
+import json
+import subprocess
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+FRAMES = 10
+
+CHILD = """
+import json, time
+from ui.controllers.emotion_recognition import model_provider, EmotionPipeline
+from ui.controllers.frame_sources import SyntheticSource, FAST
+from ui.utils.runtime_config import WARMUP_ENABLED
+
+model_provider.wait()
+pipeline = EmotionPipeline(['Annoyed', 'Happiness', 'Sad', 'Upset'])
+if WARMUP_ENABLED:
+    pipeline.warm_up()
+sources = [SyntheticSource(faces=faces, pacing=FAST) for faces in (1, 2, 3)]
+timings = []
+for i in range({frames}):
+    _, frame = sources[i % 3].read()
+    start = time.perf_counter()
+    pipeline.process(frame)
+    timings.append((time.perf_counter() - start) * 1000)
+print("TIMINGS", json.dumps(timings), flush=True)
+"""
+
+
+def frame_timings(warmup):
+    """Returns the per-frame milliseconds of the first FRAMES frames in a fresh interpreter."""
+    env = dict(os.environ, SOCIALSYNC_WARMUP="1" if warmup else "0")
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(frames=FRAMES)],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("TIMINGS"):
+            return json.loads(line.split(" ", 1)[1])
+    raise RuntimeError(f"Benchmark process failed:\n{result.stderr}")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    print(f"{'warm-up':>7} | {'first frame ms':>14} | {'first 10 frames ms':>18} | {'slowest frame ms':>16}")
+    for warmup in (False, True):
+        results = np.array([frame_timings(warmup) for _ in range(runs)])
+        print(f"{'on' if warmup else 'off':>7} | {np.median(results[:, 0]):>14.1f} | "
+              f"{np.median(results.sum(axis=1)):>18.1f} | {np.median(results.max(axis=1)):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Checks that the TFLite backend agrees with the Keras model on a held-out image set.
+The image set uses the <class name>/<image> layout of the FER notebook test split.
+
+Run from the project root after exporting the model:
+    python -m ui.scripts.check_tflite_parity <held-out dir> [model.tflite]
+"""
+import sys
+import numpy as np
+from ui.controllers.emotion_recognition import preprocess
+from ui.controllers.inference_backends import KerasBackend, TFLiteBackend
+from ui.scripts.export_tflite import KERAS_MODEL_PATH, TFLITE_MODEL_PATH
+from ui.utils.dataset_utils import load_image_directory
+from ui.utils.thread_budget import thread_plan
+
+BATCH_SIZE = 32
+# Largest accepted absolute difference between the two backends' probabilities
+MAX_PROBABILITY_DIFF = 1e-3
+# Smallest accepted share of images where both backends pick the same class
+MIN_AGREEMENT = 0.99
+
+
+def predict_all(backend, batch):
+    return np.concatenate([
+        backend.predict(batch[start:start + BATCH_SIZE]) for start in range(0, len(batch), BATCH_SIZE)
+    ])
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    tflite_path = sys.argv[2] if len(sys.argv) > 2 else TFLITE_MODEL_PATH
+
+    images, labels, class_names = load_image_directory(sys.argv[1])
+    batch = np.stack([preprocess(image) for image in images]).astype(np.float32)
+
+    keras_probs = predict_all(KerasBackend(KERAS_MODEL_PATH), batch)
+    tflite_probs = predict_all(TFLiteBackend(tflite_path, num_threads=thread_plan()["tflite"]), batch)
+
+    keras_pred = np.argmax(keras_probs, axis=1)
+    tflite_pred = np.argmax(tflite_probs, axis=1)
+    max_diff = float(np.max(np.abs(keras_probs - tflite_probs)))
+    agreement = float(np.mean(keras_pred == tflite_pred))
+
+    print(f"Images: {len(images)} in {len(class_names)} classes {class_names}")
+    print(f"Keras accuracy:  {np.mean(keras_pred == labels):.4f}")
+    print(f"TFLite accuracy: {np.mean(tflite_pred == labels):.4f}")
+    print(f"Top-1 agreement: {agreement:.4f}")
+    print(f"Max probability difference: {max_diff:.2e}")
+
+    if max_diff > MAX_PROBABILITY_DIFF or agreement < MIN_AGREEMENT:
+        print("FAIL: TFLite backend does not match the Keras model")
+        sys.exit(1)
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
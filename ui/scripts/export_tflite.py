@@ -0,0 +1,23 @@
+"""
+Converts ui/ml/model.h5 to a .tflite flatbuffer for the TFLite inference backend.
+
+Run from the project root:
+    python -m ui.scripts.export_tflite [output.tflite]
+"""
+import os
+import sys
+from ui.controllers.inference_backends import export_tflite
+
+ML_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ml"))
+KERAS_MODEL_PATH = os.path.join(ML_DIR, "model.h5")
+TFLITE_MODEL_PATH = os.path.join(ML_DIR, "model.tflite")
+
+
+def main():
+    output_path = sys.argv[1] if len(sys.argv) > 1 else TFLITE_MODEL_PATH
+    size = export_tflite(KERAS_MODEL_PATH, output_path)
+    print(f"Wrote {output_path} ({size / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Builds fp16 and int8 post-training quantized variants of the FER model and reports
+model size, load time, per-image latency and per-class accuracy for each variant.
+
+int8 calibration uses a representative sample of the fer2013 Training rows the
+FER notebooks train on; evaluation uses the PublicTest and PrivateTest rows.
+
+Run from the project root:
+    python -m ui.scripts.quantize_model <path to fer2013.csv> [report.json]
+"""
+import os
+import sys
+import json
+import time
+import numpy as np
+from ui.controllers.emotion_recognition import preprocess
+from ui.controllers.inference_backends import KerasBackend, TFLiteBackend, export_tflite
+from ui.scripts.export_tflite import ML_DIR, KERAS_MODEL_PATH, TFLITE_MODEL_PATH
+from ui.utils.dataset_utils import load_fer2013_csv
+from ui.utils.thread_budget import thread_plan
+
+CALIBRATION_SAMPLES = 500
+EVALUATION_SAMPLES = 2000
+LATENCY_SAMPLES = 200
+REPORT_PATH = os.path.join(ML_DIR, "quantization_report.json")
+
+VARIANTS = {
+    "fp32": TFLITE_MODEL_PATH,
+    "fp16": os.path.join(ML_DIR, "model_fp16.tflite"),
+    "int8": os.path.join(ML_DIR, "model_int8.tflite"),
+}
+
+
+def evaluate(name, path, load, images, labels, class_names):
+    """Loads one variant and measures size, load time, latency and per-class accuracy."""
+    start = time.perf_counter()
+    backend = load(path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    # Per-image latency, as the worker sees it for a single face
+    backend.predict(images[:1])
+    timings = []
+    for image in images[:LATENCY_SAMPLES]:
+        start = time.perf_counter()
+        backend.predict(image[np.newaxis])
+        timings.append((time.perf_counter() - start) * 1000)
+
+    predictions = np.concatenate([
+        np.argmax(backend.predict(images[i:i + 32]), axis=1) for i in range(0, len(images), 32)
+    ])
+    per_class = {
+        class_name: float(np.mean(predictions[labels == label] == label)) if np.any(labels == label) else None
+        for label, class_name in enumerate(class_names)
+    }
+    return {
+        "variant": name,
+        "path": path,
+        "size_kib": os.path.getsize(path) / 1024,
+        "load_ms": load_ms,
+        "latency_p50_ms": float(np.median(timings)),
+        "latency_p95_ms": float(np.percentile(timings, 95)),
+        "accuracy": float(np.mean(predictions == labels)),
+        "per_class_accuracy": per_class,
+    }
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    csv_path = sys.argv[1]
+    report_path = sys.argv[2] if len(sys.argv) > 2 else REPORT_PATH
+
+    def prepare(images):
+        return np.stack([preprocess(image) for image in images]).astype(np.float32)
+
+    calibration, _, _ = load_fer2013_csv(csv_path, ("Training",), limit=CALIBRATION_SAMPLES)
+    test_images, test_labels, class_names = load_fer2013_csv(
+        csv_path, ("PublicTest", "PrivateTest"), limit=EVALUATION_SAMPLES
+    )
+    calibration = prepare(calibration)
+    test_images = prepare(test_images)
+
+    for quantization, path in VARIANTS.items():
+        size = export_tflite(KERAS_MODEL_PATH, path,
+                             quantization=None if quantization == "fp32" else quantization,
+                             representative_images=calibration)
+        print(f"Wrote {path} ({size / 1024:.1f} KiB)")
+
+    results = [evaluate("keras", KERAS_MODEL_PATH, KerasBackend, test_images, test_labels, class_names)]
+    for name, path in VARIANTS.items():
+        results.append(evaluate(
+            name, path, lambda p: TFLiteBackend(p, num_threads=thread_plan()["tflite"]),
+            test_images, test_labels, class_names,
+        ))
+
+    print(f"{'variant':>7} | {'size KiB':>9} | {'load ms':>8} | {'p50 ms':>7} | {'p95 ms':>7} | {'accuracy':>8}")
+    for result in results:
+        print(f"{result['variant']:>7} | {result['size_kib']:>9.1f} | {result['load_ms']:>8.1f} | "
+              f"{result['latency_p50_ms']:>7.2f} | {result['latency_p95_ms']:>7.2f} | {result['accuracy']:>8.4f}")
+        print("          " + ", ".join(
+            f"{name}: {'n/a' if acc is None else f'{acc:.3f}'}" for name, acc in result["per_class_accuracy"].items()
+        ))
+
+    with open(report_path, "w") as file:
+        json.dump({"calibration_samples": len(calibration), "test_samples": len(test_images),
+                   "variants": results}, file, indent=4)
+    print(f"Report written to {report_path}")
+
+
+if __name__ == "__main__":
+    main()
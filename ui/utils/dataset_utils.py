@@ -0,0 +1,83 @@
+import os
+import csv
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+# fer2013 emotion ids kept by the FER notebooks, mapped to model output indices
+# (Angry, Happy, Sad, Surprise). The other ids are dropped, as in the notebooks.
+FER2013_CLASS_MAP = {0: 0, 3: 1, 4: 2, 5: 3}
+FER2013_CLASS_NAMES = ["Angry", "Happy", "Sad", "Surprise"]
+
+
+def load_image_directory(directory, limit_per_class=None):
+    """
+    Loads a labelled image set laid out as <directory>/<class name>/<image>,
+    the layout the FER notebooks write their train/test splits in.
+    Classes are sorted alphabetically, matching flow_from_directory.
+    Returns (images, labels, class_names) with images as gray uint8 arrays.
+    """
+    class_names = sorted(
+        name for name in os.listdir(directory) if os.path.isdir(os.path.join(directory, name))
+    )
+    images, labels = [], []
+    for label, class_name in enumerate(class_names):
+        class_dir = os.path.join(directory, class_name)
+        files = sorted(f for f in os.listdir(class_dir) if f.lower().endswith(IMAGE_EXTENSIONS))
+        for file_name in files[:limit_per_class]:
+            image = cv2.imread(os.path.join(class_dir, file_name), cv2.IMREAD_GRAYSCALE)
+            if image is None:
+                print(f"Skipping unreadable image: {file_name}")
+                continue
+            images.append(image)
+            labels.append(label)
+    return images, np.array(labels), class_names
+
+
+def load_fer2013_csv(csv_path, usages, limit=None, seed=42):
+    """
+    Loads fer2013.csv rows whose Usage is in usages (e.g. ("Training",) or
+    ("PublicTest", "PrivateTest")), keeping the classes in FER2013_CLASS_MAP.
+    When limit is set, a random sample of that many rows is returned.
+    Returns (images, labels, class_names) with images as 48x48 gray uint8 arrays.
+    """
+    images, labels = [], []
+    with open(csv_path, newline="") as file:
+        for row in csv.DictReader(file):
+            emotion = int(row["emotion"])
+            if row["Usage"] not in usages or emotion not in FER2013_CLASS_MAP:
+                continue
+            pixels = np.array(row["pixels"].split(), dtype=np.uint8).reshape(48, 48)
+            images.append(pixels)
+            labels.append(FER2013_CLASS_MAP[emotion])
+
+    if limit is not None and limit < len(images):
+        keep = np.random.default_rng(seed).choice(len(images), size=limit, replace=False)
+        images = [images[i] for i in keep]
+        labels = [labels[i] for i in keep]
+    return images, np.array(labels), list(FER2013_CLASS_NAMES)
+
+
+def read_clip(source, limit=None):
+    """
+    Reads BGR frames from a video file or, in file name order, from a directory of images.
+    """
+    frames = []
+    if os.path.isdir(source):
+        for file_name in sorted(f for f in os.listdir(source) if f.lower().endswith(IMAGE_EXTENSIONS)):
+            if limit is not None and len(frames) >= limit:
+                break
+            image = cv2.imread(os.path.join(source, file_name))
+            if image is not None:
+                frames.append(image)
+        return frames
+
+    video = cv2.VideoCapture(source)
+    while limit is None or len(frames) < limit:
+        ret, frame = video.read()
+        if not ret:
+            break
+        frames.append(frame)
+    video.release()
+    return frames
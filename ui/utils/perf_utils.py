@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak RSS is then not reported
+    resource = None
+
+
+class StageTimer:
+    """
+    Records how long each named stage of one frame takes.
+    start() begins a frame; mark(stage) stores the time since the previous mark.
+    """
+    def __init__(self):
+        self.stages = {}
+        self.last = None
+
+    def start(self):
+        self.stages = {}
+        self.last = time.perf_counter()
+
+    def mark(self, stage):
+        now = time.perf_counter()
+        self.stages[stage] = now - self.last
+        self.last = now
+
+
+class NullStageTimer:
+    """A StageTimer that records nothing, used when instrumentation is off."""
+    stages = {}
+
+    def start(self):
+        pass
+
+    def mark(self, stage):
+        pass
+
+
+NULL_TIMER = NullStageTimer()
+
+
+def latency_summary(samples):
+    """
+    Returns the mean, p50, p95 and p99 of a list of durations in seconds, in milliseconds.
+    """
+    if len(samples) == 0:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+    ms = np.asarray(samples, dtype=np.float64) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {"mean_ms": float(ms.mean()), "p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99)}
+
+
+def peak_rss_mb():
+    """Returns the peak resident set size of this process in MiB, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def cpu_seconds():
+    """Returns the user plus system CPU time this process has used."""
+    times = os.times()
+    return times.user + times.system
+
+
+class RollingStageStats:
+    """
+    Stage durations and end times of the last window frames, kept in fixed numpy
+    rings so recording a frame never allocates. summary() reports the FPS over
+    the window and the latency of every stage.
+    """
+    def __init__(self, stages, window=120):
+        self.stages = list(stages)
+        self.window = window
+        self.durations = np.zeros((window, len(self.stages)))
+        self.frame_ends = np.zeros(window)
+        self.count = 0
+
+    def record(self, stage_times, end_time):
+        """Adds one frame; stages missing from stage_times did not run and count as 0."""
+        row = self.count % self.window
+        for column, stage in enumerate(self.stages):
+            self.durations[row, column] = stage_times.get(stage, 0.0)
+        self.frame_ends[row] = end_time
+        self.count += 1
+
+    def summary(self):
+        """Returns {"fps", "frames", "stages": {stage: latency_summary}} over the window."""
+        filled = min(self.count, self.window)
+        ends = self.frame_ends[:filled]
+        span = ends.max() - ends.min() if filled > 1 else 0.0
+        return {
+            "fps": (filled - 1) / span if span > 0 else 0.0,
+            "frames": filled,
+            "stages": {stage: latency_summary(self.durations[:filled, column])
+                       for column, stage in enumerate(self.stages)},
+        }
@@ -0,0 +1,116 @@
+import os
+
+# Runtime settings for the emotion pipeline.
+# Every value can be overridden with the environment variable next to it.
+
+# Inference backend used by detect_emotion: "keras" or "tflite"
+INFERENCE_BACKEND = os.getenv("SOCIALSYNC_INFERENCE_BACKEND", "keras").lower()
+
+# Number of threads the TFLite interpreter is pinned to; 0 takes it from
+# SOCIALSYNC_THREAD_BUDGET, or uses 2 without a budget
+TFLITE_NUM_THREADS = int(os.getenv("SOCIALSYNC_TFLITE_THREADS", "0"))
+
+# Optional path to a .tflite file; defaults to ui/ml/model.tflite
+TFLITE_MODEL_PATH = os.getenv("SOCIALSYNC_TFLITE_MODEL", "")
+
+# Face detector: "haar" (ui/ml cascade), "bundled" (a cascade from cv2.data),
+# or "tracking" (TRACKED_DETECTOR every few frames, template tracking in between)
+FACE_DETECTOR = os.getenv("SOCIALSYNC_FACE_DETECTOR", "tracking").lower()
+
+# Detector run by the "tracking" detector on its full-detection frames
+TRACKED_DETECTOR = os.getenv("SOCIALSYNC_TRACKED_DETECTOR", "haar").lower()
+
+# Cascade file from cv2.data used by the "bundled" detector
+BUNDLED_CASCADE = os.getenv("SOCIALSYNC_BUNDLED_CASCADE", "haarcascade_frontalface_alt2.xml")
+
+# Run the full detection at least once every this many frames while tracking
+DETECT_INTERVAL = int(os.getenv("SOCIALSYNC_DETECT_INTERVAL", "10"))
+
+# Re-detect early when a track's template match score drops below this value
+TRACK_MIN_CONFIDENCE = float(os.getenv("SOCIALSYNC_TRACK_MIN_CONFIDENCE", "0.6"))
+
+# Largest number of faces classified in one batch; warm-up covers every size up to it
+MAX_BATCH_SIZE = int(os.getenv("SOCIALSYNC_MAX_BATCH_SIZE", "5"))
+
+# Run synthetic batches through the model before the first real frame
+WARMUP_ENABLED = os.getenv("SOCIALSYNC_WARMUP", "1") == "1"
+
+# Downscale applied to the gray frame before Haar detection in the emotion pipeline:
+# "auto" derives it from the minimum face size, 1.0 detects at full resolution
+DETECTION_SCALE = os.getenv("SOCIALSYNC_DETECTION_SCALE", "auto")
+
+# Where frames come from: "camera", "video" (a recorded clip), "images" (a directory
+# of frames) or "synthetic" (deterministic generated frames, no device needed)
+FRAME_SOURCE = os.getenv("SOCIALSYNC_FRAME_SOURCE", "camera").lower()
+
+# Clip file or image directory read by the "video" and "images" sources
+FRAME_SOURCE_PATH = os.getenv("SOCIALSYNC_FRAME_SOURCE_PATH", "")
+
+# "realtime" replays recorded and synthetic frames at their frame rate, "fast" as fast as possible
+FRAME_SOURCE_PACING = os.getenv("SOCIALSYNC_FRAME_SOURCE_PACING", "realtime").lower()
+
+# Replay recorded clips from the start when they end
+FRAME_SOURCE_LOOP = os.getenv("SOCIALSYNC_FRAME_SOURCE_LOOP", "0") == "1"
+
+# Camera device index used by the "camera" source
+CAMERA_INDEX = int(os.getenv("SOCIALSYNC_CAMERA_INDEX", "0"))
+
+# Resolution the shared camera is opened at, and the frames skipped after opening
+# it while its exposure settles
+CAMERA_WIDTH = int(os.getenv("SOCIALSYNC_CAMERA_WIDTH", "640"))
+CAMERA_HEIGHT = int(os.getenv("SOCIALSYNC_CAMERA_HEIGHT", "480"))
+CAMERA_WARMUP_FRAMES = int(os.getenv("SOCIALSYNC_CAMERA_WARMUP_FRAMES", "30"))
+
+# Time every stage of the emotion worker and show the developer overlay on the
+# session dashboard (toggle it at runtime with Ctrl+Shift+D)
+INSTRUMENTATION_ENABLED = os.getenv("SOCIALSYNC_INSTRUMENTATION", "0") == "1"
+
+# Half-life in seconds of the per-face emotion smoothing; 0 shows raw predictions
+SMOOTHING_HALF_LIFE = float(os.getenv("SOCIALSYNC_SMOOTHING_HALF_LIFE", "0.5"))
+
+# Default seconds of results the session dashboard's emotion percentages and confidence
+# cover, unless the session sets its own; the overview gets one summary per window
+EMOTION_WINDOW_SECONDS = float(os.getenv("SOCIALSYNC_EMOTION_WINDOW", "3"))
+
+# Times per second the session dashboard repaints its emotion bars and confidence;
+# results arriving in between are coalesced. The video is shown at its own rate.
+# Values below 1 are raised to 1
+METRICS_REFRESH_FPS = max(1.0, float(os.getenv("SOCIALSYNC_METRICS_FPS", "5")))
+
+# Adaptive inference rate: detection and classification run less often when the
+# emotion worker would exceed this FPS target or this CPU budget (in cores, e.g. 0.5);
+# 0 disables either bound, and with both at 0 every frame is fully processed
+RATE_TARGET_FPS = float(os.getenv("SOCIALSYNC_TARGET_FPS", "0"))
+RATE_CPU_BUDGET = float(os.getenv("SOCIALSYNC_CPU_BUDGET", "0"))
+
+# Number of processes of the shared inference service; 0 runs the model in-process.
+# Each process loads the model once and serves every session of the application
+INFERENCE_PROCESSES = int(os.getenv("SOCIALSYNC_INFERENCE_PROCESSES", "0"))
+
+# Classify the faces of every stream in the process together on the shared model:
+# a batch runs once it holds SOCIALSYNC_BATCH_SIZE faces or its oldest face has
+# waited SOCIALSYNC_BATCH_DELAY_MS milliseconds
+BATCH_SCHEDULER_ENABLED = os.getenv("SOCIALSYNC_BATCH_SCHEDULER", "0") == "1"
+BATCH_SCHEDULER_SIZE = int(os.getenv("SOCIALSYNC_BATCH_SIZE", "16"))
+BATCH_SCHEDULER_DELAY = float(os.getenv("SOCIALSYNC_BATCH_DELAY_MS", "5")) / 1000.0
+
+# Total CPU threads the app should use; 0 leaves OpenCV and TensorFlow at their
+# defaults. One thread is kept for the Qt UI and the rest is split between
+# OpenCV and TensorFlow (see ui/utils/thread_budget.py)
+THREAD_BUDGET = int(os.getenv("SOCIALSYNC_THREAD_BUDGET", "0"))
+
+# Explicit thread counts, overriding the split of the budget; 0 leaves the split's value
+OPENCV_THREADS = int(os.getenv("SOCIALSYNC_OPENCV_THREADS", "0"))
+TF_INTRA_OP_THREADS = int(os.getenv("SOCIALSYNC_TF_INTRA_OP_THREADS", "0"))
+TF_INTER_OP_THREADS = int(os.getenv("SOCIALSYNC_TF_INTER_OP_THREADS", "0"))
+
+# Opt-in: hand processed frames from the emotion worker through a shared-memory ring
+# of SOCIALSYNC_FRAME_RING_SLOTS slots in /dev/shm; only slot indices cross the Qt
+# event queue and the dashboard paints from the slot. Otherwise it gets converted images
+SHARED_FRAMES_ENABLED = os.getenv("SOCIALSYNC_SHARED_FRAMES", "0") == "1"
+FRAME_RING_SLOTS = int(os.getenv("SOCIALSYNC_FRAME_RING_SLOTS", "4"))
+
+# Deliver the emotion worker's results through a single latest-value slot that the
+# UI empties when it is ready, instead of queueing every result in the Qt event
+# queue; results the UI had no time for are coalesced into the newest one
+RESULT_MAILBOX_ENABLED = os.getenv("SOCIALSYNC_RESULT_MAILBOX", "1") == "1"
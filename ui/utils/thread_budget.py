@@ -0,0 +1,67 @@
+import cv2
+from ui.utils.runtime_config import (THREAD_BUDGET, OPENCV_THREADS, TF_INTRA_OP_THREADS, TF_INTER_OP_THREADS,
+                                     TFLITE_NUM_THREADS, INFERENCE_BACKEND, INFERENCE_PROCESSES)
+
+# TFLite interpreter threads when neither a budget nor SOCIALSYNC_TFLITE_THREADS sets them
+DEFAULT_TFLITE_THREADS = 2
+
+
+def split_thread_budget(budget, backend="keras", processes=0):
+    """
+    Splits a total thread budget: one thread stays free for the Qt UI, and the rest
+    is shared between OpenCV's pool and the model. The model's share goes to
+    TensorFlow's intra-op pool, or to the TFLite interpreter with the tflite
+    backend, and is divided between the inference service's processes when there
+    are any; the counts are per process. TensorFlow gets a single inter-op thread,
+    since the model is one chain of ops.
+    """
+    available = max(1, budget - 1)
+    opencv = max(1, available // 2)
+    model = max(1, (available - opencv) // max(1, processes))
+    if backend == "tflite":
+        return {"opencv": opencv, "tf_intra_op": 1, "tf_inter_op": 1, "tflite": model}
+    return {"opencv": opencv, "tf_intra_op": model, "tf_inter_op": 1, "tflite": 1}
+
+
+def thread_plan():
+    """
+    Returns the thread counts configured in runtime_config as
+    {"opencv", "tf_intra_op", "tf_inter_op", "tflite"}, the TensorFlow and TFLite
+    counts being per inference process; None leaves a library at its default.
+    """
+    if THREAD_BUDGET > 0:
+        plan = split_thread_budget(THREAD_BUDGET, INFERENCE_BACKEND, INFERENCE_PROCESSES)
+    else:
+        plan = dict.fromkeys(("opencv", "tf_intra_op", "tf_inter_op"))
+        plan["tflite"] = DEFAULT_TFLITE_THREADS
+    for key, value in (("opencv", OPENCV_THREADS), ("tf_intra_op", TF_INTRA_OP_THREADS),
+                       ("tf_inter_op", TF_INTER_OP_THREADS), ("tflite", TFLITE_NUM_THREADS)):
+        if value > 0:
+            plan[key] = value
+    return plan
+
+
+def apply_opencv_threads(plan=None):
+    """Sets the size of OpenCV's thread pool. Call it at startup."""
+    plan = plan or thread_plan()
+    if plan["opencv"] is not None:
+        cv2.setNumThreads(plan["opencv"])
+
+
+def apply_tensorflow_threads(plan=None):
+    """
+    Sets TensorFlow's intra-op and inter-op pool sizes. It must run after
+    TensorFlow is imported and before the first op; TensorFlow is loaded lazily,
+    so the model loaders call it rather than main.py.
+    """
+    plan = plan or thread_plan()
+    if plan["tf_intra_op"] is None and plan["tf_inter_op"] is None:
+        return
+    import tensorflow as tf
+    try:
+        if plan["tf_intra_op"] is not None:
+            tf.config.threading.set_intra_op_parallelism_threads(plan["tf_intra_op"])
+        if plan["tf_inter_op"] is not None:
+            tf.config.threading.set_inter_op_parallelism_threads(plan["tf_inter_op"])
+    except RuntimeError as e:
+        print(f"TensorFlow thread settings not applied: {e}")